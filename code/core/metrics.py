@@ -1,5 +1,5 @@
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Tuple
 from prometheus_client import Counter, Gauge, Histogram, start_http_server
 
 
@@ -53,6 +53,9 @@ class MetricsCollector:
             "Prediction accuracy",
             ["model", "metric"],
         )
+        # labels() returns a child of the same metric class, cached per label set
+        self._req_cache: Dict[Tuple[str, str, int], Counter] = {}
+        self._lat_cache: Dict[Tuple[str, str], Histogram] = {}
 
     def start_metrics_server(self) -> Any:
         """
@@ -65,11 +68,21 @@ class MetricsCollector:
     ) -> Any:
         """
         Track a request
+
+        Labelled children are cached per (method, endpoint, status), so
+        repeat requests skip the label lookup in prometheus_client.
         """
-        self.request_counter.labels(
-            method=method, endpoint=endpoint, status=status
-        ).inc()
-        self.request_latency.labels(method=method, endpoint=endpoint).observe(latency)
+        key = (method, endpoint, status)
+        counter = self._req_cache.get(key)
+        if counter is None:
+            counter = self.request_counter.labels(method, endpoint, str(status))
+            self._req_cache[key] = counter
+        counter.inc()
+        histogram = self._lat_cache.get(key[:2])
+        if histogram is None:
+            histogram = self.request_latency.labels(method, endpoint)
+            self._lat_cache[key[:2]] = histogram
+        histogram.observe(latency)
 
     def track_error(self, error_type: str, error_code: str) -> Any:
         """
@@ -100,10 +113,12 @@ class MetricsCollector:
         Timer decorator for tracking request latency
         """
 
+        perf_counter_ns = time.perf_counter_ns
+
         def decorator(func: Callable) -> Callable:
 
             def wrapper(*args, **kwargs) -> Any:
-                start_time = time.time()
+                start_ns = perf_counter_ns()
                 try:
                     result = func(*args, **kwargs)
                     status = 200
@@ -113,7 +128,7 @@ class MetricsCollector:
                     self.track_error("exception", type(e).__name__)
                     raise
                 finally:
-                    latency = time.time() - start_time
+                    latency = (perf_counter_ns() - start_ns) * 1e-09
                     self.track_request(method, endpoint, status, latency)
 
             return wrapper
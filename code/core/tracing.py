@@ -1,4 +1,6 @@
 import functools
+import logging
+import os
 from typing import Any, Callable, Dict, Optional
 from opentelemetry import trace
 from opentelemetry.exporter.jaeger.thrift import JaegerExporter
@@ -7,6 +9,13 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
+SPAN_MAX_QUEUE_SIZE = 8192
+SPAN_MAX_EXPORT_BATCH_SIZE = 1024
+SPAN_SCHEDULE_DELAY_MILLIS = 1000
+_ATTRIBUTE_TYPES = frozenset({str, int, float, bool})
+_ARG_KEYS = tuple(f"arg_{i}" for i in range(32))
+logger = logging.getLogger(__name__)
+
 
 class TracingManager:
     """
@@ -19,14 +28,40 @@ class TracingManager:
         self.service_name = service_name
         resource = Resource(attributes={SERVICE_NAME: service_name})
         trace.set_tracer_provider(TracerProvider(resource=resource))
-        jaeger_exporter = JaegerExporter(
-            agent_host_name=jaeger_host, agent_port=jaeger_port
+        span_processor = BatchSpanProcessor(
+            self._create_exporter(jaeger_host, jaeger_port),
+            max_queue_size=SPAN_MAX_QUEUE_SIZE,
+            max_export_batch_size=SPAN_MAX_EXPORT_BATCH_SIZE,
+            schedule_delay_millis=SPAN_SCHEDULE_DELAY_MILLIS,
         )
-        span_processor = BatchSpanProcessor(jaeger_exporter)
         trace.get_tracer_provider().add_span_processor(span_processor)
         self.tracer = trace.get_tracer(service_name)
         self.propagator = TraceContextTextMapPropagator()
 
+    @staticmethod
+    def _create_exporter(jaeger_host: str, jaeger_port: int) -> Any:
+        """
+        Create the span exporter selected by OTEL_TRACES_EXPORTER
+
+        "otlp" exports over OTLP/gRPC (endpoint from the standard
+        OTEL_EXPORTER_OTLP_* variables); anything else keeps the Jaeger agent.
+        Without the optional opentelemetry-exporter-otlp package, "otlp"
+        falls back to the Jaeger agent with a warning.
+        """
+        if os.getenv("OTEL_TRACES_EXPORTER", "jaeger").lower() == "otlp":
+            try:
+                from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                    OTLPSpanExporter,
+                )
+            except ImportError:
+                logger.warning(
+                    "OTEL_TRACES_EXPORTER=otlp but opentelemetry-exporter-otlp "
+                    "is not installed; exporting spans to the Jaeger agent"
+                )
+            else:
+                return OTLPSpanExporter()
+        return JaegerExporter(agent_host_name=jaeger_host, agent_port=jaeger_port)
+
     def trace_function(self, name: Optional[str] = None) -> Any:
         """
         Decorator for tracing a function
@@ -38,12 +73,14 @@ class TracingManager:
             def wrapper(*args, **kwargs) -> Any:
                 span_name = name or func.__name__
                 with self.tracer.start_as_current_span(span_name) as span:
-                    for i, arg in enumerate(args):
-                        if isinstance(arg, (str, int, float, bool)):
-                            span.set_attribute(f"arg_{i}", str(arg))
-                    for key, value in kwargs.items():
-                        if isinstance(value, (str, int, float, bool)):
-                            span.set_attribute(f"kwarg_{key}", str(value))
+                    if span.is_recording():
+                        for i, arg in enumerate(args):
+                            if type(arg) in _ATTRIBUTE_TYPES:
+                                key = _ARG_KEYS[i] if i < len(_ARG_KEYS) else f"arg_{i}"
+                                span.set_attribute(key, arg)
+                        for key, value in kwargs.items():
+                            if type(value) in _ATTRIBUTE_TYPES:
+                                span.set_attribute(f"kwarg_{key}", value)
                     try:
                         result = func(*args, **kwargs)
                         return result
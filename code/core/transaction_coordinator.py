@@ -1,27 +1,49 @@
 import time
 import uuid
-from enum import Enum
-from typing import Any, Dict, Optional
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
 
 
-class TransactionStatus(Enum):
-    CREATED = "CREATED"
-    PREPARED = "PREPARED"
-    COMMITTED = "COMMITTED"
-    ABORTED = "ABORTED"
+class TransactionStatus(IntEnum):
+    CREATED = 0
+    PREPARED = 1
+    COMMITTED = 2
+    ABORTED = 3
 
 
 class TransactionParticipant:
     """
     Interface for transaction participants
+
+    Participants may expose a ``host`` attribute; participants that share a
+    host are prepared together through a single ``batch_prepare`` call.
+    Participants that can commit atomically without a prepare phase set
+    ``supports_single_phase`` to True.
     """
 
+    supports_single_phase: bool = False
+
     def prepare(self, transaction_id: str) -> bool:
         """
         Prepare resources for the transaction
         """
         raise NotImplementedError("Participant must implement prepare method")
 
+    def batch_prepare(
+        self, transaction_ids: List[str], participants: List["TransactionParticipant"]
+    ) -> List[bool]:
+        """
+        Prepare several co-located participants in one round trip
+
+        ``transaction_ids[i]`` is the transaction to prepare on
+        ``participants[i]``. Remote participants should override this to send
+        a single message to their host.
+        """
+        return [
+            participant.prepare(transaction_id)
+            for transaction_id, participant in zip(transaction_ids, participants)
+        ]
+
     def commit(self, transaction_id: str) -> bool:
         """
         Commit the prepared transaction
@@ -75,23 +97,49 @@ class TransactionCoordinator:
         transaction = self.transactions[transaction_id]
         if transaction["status"] != TransactionStatus.CREATED:
             return False
-        prepared_participants = []
-        for participant in transaction["participants"]:
+        for group in self._group_by_host(transaction["participants"]):
             try:
-                if not participant.prepare(transaction_id):
+                if len(group) == 1:
+                    prepared = group[0].prepare(transaction_id)
+                else:
+                    results = group[0].batch_prepare(
+                        [transaction_id] * len(group), group
+                    )
+                    prepared = len(results) == len(group) and all(results)
+                if not prepared:
                     for p in transaction["participants"]:
                         p.abort(transaction_id)
                     transaction["status"] = TransactionStatus.ABORTED
                     return False
-                prepared_participants.append(participant)
             except Exception:
                 for p in transaction["participants"]:
                     p.abort(transaction_id)
                 transaction["status"] = TransactionStatus.ABORTED
                 return False
         transaction["status"] = TransactionStatus.PREPARED
+        transaction["prepared_at"] = time.time()
         return True
 
+    @staticmethod
+    def _group_by_host(
+        participants: List[TransactionParticipant],
+    ) -> List[List[TransactionParticipant]]:
+        """
+        Group participants sharing a host, keeping registration order
+        """
+        groups: List[List[TransactionParticipant]] = []
+        by_host: Dict[Any, List[TransactionParticipant]] = {}
+        for participant in participants:
+            host = getattr(participant, "host", None)
+            if host is None:
+                groups.append([participant])
+            elif host in by_host:
+                by_host[host].append(participant)
+            else:
+                by_host[host] = [participant]
+                groups.append(by_host[host])
+        return groups
+
     def commit_transaction(self, transaction_id: str) -> bool:
         """
         Commit the prepared transaction
@@ -110,6 +158,30 @@ class TransactionCoordinator:
         transaction["status"] = TransactionStatus.COMMITTED
         return True
 
+    @staticmethod
+    def _supports_single_phase(participant: TransactionParticipant) -> bool:
+        """
+        Check the capability flag strictly so mocks do not opt in implicitly
+        """
+        return getattr(participant, "supports_single_phase", False) is True
+
+    def _commit_single_phase(
+        self, transaction_id: str, transaction: Dict[str, Any]
+    ) -> bool:
+        """
+        Commit a single-participant transaction in one round
+        """
+        participant = transaction["participants"][0]
+        try:
+            committed = participant.commit(transaction_id)
+        except Exception:
+            committed = False
+        if not committed:
+            self.abort_transaction(transaction_id)
+            return False
+        transaction["status"] = TransactionStatus.COMMITTED
+        return True
+
     def abort_transaction(self, transaction_id: str) -> bool:
         """
         Abort the transaction
@@ -135,10 +207,37 @@ class TransactionCoordinator:
             return None
         return self.transactions[transaction_id]["status"]
 
+    def find_stuck_transactions(self, timeout_seconds: float) -> List[str]:
+        """
+        Find transactions left in PREPARED for longer than the timeout
+
+        The age is measured from when the transaction entered PREPARED, not
+        from its creation.
+        """
+        cutoff = time.time() - timeout_seconds
+        prepared = TransactionStatus.PREPARED
+        return [
+            transaction_id
+            for transaction_id, transaction in self.transactions.items()
+            if transaction["status"] == prepared
+            and transaction.get("prepared_at", transaction["created_at"]) < cutoff
+        ]
+
     def execute_transaction(self, transaction_id: str) -> bool:
         """
         Execute a transaction (prepare and commit)
-        """
+
+        A lone participant that supports single-phase commit is committed
+        directly, skipping the prepare round.
+        """
+        transaction = self.transactions.get(transaction_id)
+        if (
+            transaction is not None
+            and transaction["status"] == TransactionStatus.CREATED
+            and len(transaction["participants"]) == 1
+            and self._supports_single_phase(transaction["participants"][0])
+        ):
+            return self._commit_single_phase(transaction_id, transaction)
         if not self.prepare_transaction(transaction_id):
             return False
         return self.commit_transaction(transaction_id)
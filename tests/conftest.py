@@ -2,6 +2,9 @@
 Common test fixtures for Fluxora backend tests.
 """
 
+import importlib
+from typing import Any
+
 import pytest
 from fastapi.testclient import TestClient
 from fluxora.backend.dependencies import get_db
@@ -11,6 +14,23 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 TEST_DATABASE_URL = "sqlite:///./test.db"
+HEAVY_MODULES = ("numpy", "pandas")
+VISUALIZATION_MODULES = ("plotly.graph_objects", "plotly.io")
+
+
+def pytest_configure(config: Any) -> None:
+    """Register markers and import heavy libraries once per worker."""
+    config.addinivalue_line(
+        "markers", "visualization: tests that build or render Plotly charts"
+    )
+    modules = HEAVY_MODULES
+    if "not visualization" not in (config.getoption("markexpr") or ""):
+        modules += VISUALIZATION_MODULES
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
 
 
 @pytest.fixture(scope="session")
@@ -43,13 +43,9 @@ class TestMonitoringIntegration(unittest.TestCase):
 
         result = test_function()
         self.assertEqual(result, "success")
-        mock_counter_instance.labels.assert_called_with(
-            method="GET", endpoint="/test", status=200
-        )
+        mock_counter_instance.labels.assert_called_with("GET", "/test", "200")
         mock_counter_instance.inc.assert_called_once()
-        mock_histogram_instance.labels.assert_called_with(
-            method="GET", endpoint="/test"
-        )
+        mock_histogram_instance.labels.assert_called_with("GET", "/test")
         mock_histogram_instance.observe.assert_called_once()
         clear_request_context()
 
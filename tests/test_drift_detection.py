@@ -0,0 +1,290 @@
+"""
+Tests for the drift detection statistics in tools/monitoring.
+
+The hand-written drift statistics are checked against SciPy and against the
+plain NumPy definitions, and the Numba kernels against their NumPy fallbacks.
+"""
+
+import os
+import sys
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.spatial.distance import jensenshannon
+from scipy.stats import chi2_contingency, ks_2samp
+
+sys.path.insert(
+    0,
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "tools", "monitoring")
+    ),
+)
+import _drift_kernels
+import drift_detection
+from drift_detection import DriftDetector, StreamingDriftState
+
+COLUMN_MAPPING = {
+    "numerical_features": ["x", "y"],
+    "categorical_features": ["c"],
+}
+requires_numba = pytest.mark.skipif(
+    not _drift_kernels.NUMBA_AVAILABLE, reason="numba is not installed"
+)
+
+
+def _frame(rng: Any, n: int, shift: float = 0.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "x": rng.normal(shift, 1.0, n),
+            "y": rng.integers(0, 20, n).astype(float) + shift,
+            "c": rng.choice(["a", "b", "c"], n, p=[0.5, 0.3, 0.2]),
+        }
+    )
+
+
+@pytest.fixture
+def rng() -> Any:
+    """Seeded random generator."""
+    return np.random.default_rng(42)
+
+
+@pytest.fixture
+def detector(tmp_path: Any, rng: Any) -> Any:
+    """Drift detector over a seeded reference frame."""
+    return DriftDetector(
+        reference_data=_frame(rng, 500),
+        column_mapping=COLUMN_MAPPING,
+        model_registry_path=str(tmp_path),
+    )
+
+
+@pytest.mark.parametrize(
+    "n,m,integer",
+    [(50, 50, False), (300, 40, False), (7, 900, False), (200, 150, True)],
+)
+def test_ks_pvalue_matches_scipy(rng: Any, n: int, m: int, integer: bool) -> Any:
+    """Test the KS p-value against scipy's asymptotic ks_2samp, ties included"""
+    ref = rng.normal(0.0, 1.0, n)
+    cur = rng.normal(0.3, 1.2, m)
+    if integer:
+        ref, cur = np.round(ref * 3), np.round(cur * 3)
+    expected = ks_2samp(ref, cur, method="asymp").pvalue
+    assert drift_detection._ks_pvalue(np.sort(ref), cur) == pytest.approx(
+        expected, rel=1e-9, abs=1e-12
+    )
+
+
+@pytest.mark.parametrize(
+    "ref_counts,cur_counts",
+    [
+        ([40, 35, 25], [30, 30, 40]),
+        ([60, 40], [45, 55]),
+        ([10, 0, 30, 5], [12, 0, 20, 9]),
+        ([50, 50], [20, 30, 10]),
+    ],
+    ids=["3-categories", "2x2-yates", "empty-category", "unseen-category"],
+)
+def test_chi2_pvalue_matches_scipy(ref_counts: Any, cur_counts: Any) -> Any:
+    """Test the chi-square p-value against scipy's chi2_contingency"""
+    ref_counts = np.array(ref_counts)
+    cur_counts = np.array(cur_counts)
+    table = np.vstack(
+        [np.pad(ref_counts, (0, cur_counts.size - ref_counts.size)), cur_counts]
+    )
+    table = table[:, table.sum(axis=0) > 0]
+    expected = chi2_contingency(table).pvalue
+    assert drift_detection._chi2_pvalue(ref_counts, cur_counts) == pytest.approx(
+        expected, rel=1e-9
+    )
+
+
+def test_fast_drift_ks_scores_match_scipy(detector: Any, rng: Any) -> Any:
+    """Test per-feature fast-path scores against 1 - p from scipy"""
+    current = _frame(rng, 400, shift=0.2)
+    ref_stats = detector._reference_stats()
+    coerced = detector._coerce_dtypes(current, COLUMN_MAPPING, ref_stats.categories)
+    _, scores = detector._fast_drift(ref_stats, coerced, COLUMN_MAPPING, "ks")
+    reference = detector.reference_data
+    for col in ("x", "y"):
+        expected = ks_2samp(
+            reference[col].to_numpy(np.float32),
+            current[col].to_numpy(np.float32),
+            method="asymp",
+        ).pvalue
+        assert scores[col] == pytest.approx(1.0 - expected, rel=1e-9, abs=1e-12)
+    table = pd.crosstab(
+        np.repeat([0, 1], [len(reference), len(current)]),
+        np.concatenate([reference["c"].astype(str), current["c"].astype(str)]),
+    )
+    assert scores["c"] == pytest.approx(1.0 - chi2_contingency(table).pvalue)
+
+
+class _ScipyReport:
+    """Stand-in for an Evidently Report running the KS and chi-square tests."""
+
+    def __init__(self, metrics: Any) -> None:
+        self.preset = metrics[0]
+        self.features = {}
+
+    def run(self, reference_data: Any, current_data: Any) -> None:
+        for col in self.preset.num_feature_names:
+            self.features[col] = ks_2samp(
+                reference_data[col], current_data[col], method="asymp"
+            ).pvalue
+        for col in self.preset.cat_feature_names:
+            table = pd.crosstab(
+                np.repeat([0, 1], [len(reference_data), len(current_data)]),
+                np.concatenate([reference_data[col], current_data[col]]),
+            )
+            self.features[col] = chi2_contingency(table).pvalue
+
+    def as_dict(self) -> Any:
+        features = {col: {"drift_score": p} for col, p in self.features.items()}
+        return {"data_drift": {"data": {"metrics": {"features": features}}}}
+
+
+class _Preset:
+    def __init__(self, **kwargs: Any) -> None:
+        self.__dict__.update(kwargs)
+
+
+@pytest.mark.parametrize("shift,drifted", [(0.0, False), (3.0, True)])
+def test_detailed_and_fast_paths_agree(
+    detector: Any, rng: Any, monkeypatch: Any, shift: float, drifted: bool
+) -> Any:
+    """Test that the Evidently path and the fast path share one drift rule"""
+    monkeypatch.setattr(
+        drift_detection, "_load_evidently", lambda: (_ScipyReport, _Preset)
+    )
+    current = _frame(rng, 400, shift=shift)
+    _, fast_drift, fast_score = detector.detect_drift(current)
+    report, detailed_drift, detailed_score = detector.detect_drift(
+        current, detailed_report=True
+    )
+    assert report.preset.num_stattest == "ks"
+    assert fast_drift is detailed_drift is drifted
+    assert detailed_score == pytest.approx(fast_score, abs=1e-3)
+    assert [entry["drift_score"] for entry in list(detector.drift_history)[-2:]] == [
+        fast_score,
+        detailed_score,
+    ]
+
+
+def test_psi_kernel_matches_reference_definition(detector: Any, rng: Any) -> Any:
+    """Test the PSI kernel against binning and scoring each feature directly"""
+    ref_stats = detector._reference_stats()
+    cur_mat = rng.normal(0.5, 1.5, (len(ref_stats.psi_cols), 300))
+    cur_mat[0, ::7] = np.nan
+    expected = [
+        drift_detection._psi(
+            ref_stats.ref_probs[col],
+            drift_detection._to_probs(
+                drift_detection._bin_counts(
+                    ref_stats.psi_edges[col], row[~np.isnan(row)]
+                )
+            ),
+        )
+        for col, row in zip(ref_stats.psi_cols, cur_mat)
+    ]
+    scores = _drift_kernels._psi_numpy(
+        cur_mat, ref_stats.edges_flat, ref_stats.edges_offsets, ref_stats.ref_probs_flat
+    )
+    np.testing.assert_allclose(scores, expected, rtol=1e-12)
+
+
+def test_js_matches_scipy(rng: Any) -> Any:
+    """Test the Jensen-Shannon divergence against scipy's distance squared"""
+    ref_probs = rng.dirichlet(np.ones(8))
+    cur_probs = rng.dirichlet(np.ones(8))
+    assert drift_detection._js(ref_probs, cur_probs) == pytest.approx(
+        jensenshannon(ref_probs, cur_probs) ** 2, rel=1e-9
+    )
+
+
+@requires_numba
+def test_psi_kernel_numba_matches_numpy(detector: Any, rng: Any) -> Any:
+    """Test the Numba PSI kernel against its NumPy fallback"""
+    ref_stats = detector._reference_stats()
+    cur_mat = rng.normal(0.5, 1.5, (len(ref_stats.psi_cols), 300))
+    cur_mat[1, ::5] = np.nan
+    args = (
+        cur_mat,
+        ref_stats.edges_flat,
+        ref_stats.edges_offsets,
+        ref_stats.ref_probs_flat,
+    )
+    np.testing.assert_allclose(
+        _drift_kernels._psi_numba(*args), _drift_kernels._psi_numpy(*args), rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [
+        pytest.param("_stream_update_numpy", id="numpy"),
+        pytest.param("_stream_update_numba", id="numba", marks=requires_numba),
+    ],
+)
+def test_streaming_state_matches_batch_statistics(
+    detector: Any, rng: Any, monkeypatch: Any, kernel: str
+) -> Any:
+    """Test streamed moments, bin counts and PSI against the concatenated data"""
+    monkeypatch.setattr(
+        drift_detection, "stream_update_kernel", getattr(_drift_kernels, kernel)
+    )
+    state = detector.streaming_state()
+    batches = [_frame(rng, n, shift=0.4) for n in (120, 1, 300)]
+    batches[0].loc[::9, "x"] = np.nan
+    for batch in batches:
+        state.update(batch)
+    combined = pd.concat(batches, ignore_index=True)
+    ref_stats = detector._reference_stats()
+    _, scores = state.check()
+    moments = state.moments()
+    for col in state.columns:
+        values = combined[col].dropna().to_numpy(np.float64)
+        assert moments[col]["count"] == values.size
+        assert moments[col]["mean"] == pytest.approx(values.mean(), rel=1e-9)
+        assert moments[col]["std"] == pytest.approx(values.std(), rel=1e-9)
+        expected_psi = drift_detection._psi(
+            ref_stats.ref_probs[col],
+            drift_detection._to_probs(
+                drift_detection._bin_counts(ref_stats.psi_edges[col], values)
+            ),
+        )
+        assert scores[col] == pytest.approx(expected_psi, rel=1e-9)
+
+
+def test_streaming_state_rejects_invalid_window(detector: Any) -> Any:
+    """Test that a window below one batch is rejected"""
+    with pytest.raises(ValueError):
+        StreamingDriftState(detector._reference_stats(), window=0)
+
+
+def test_reference_without_default_columns_fits_lazily(tmp_path: Any, rng: Any) -> Any:
+    """Test that a reference lacking the config columns works with an override"""
+    detector = DriftDetector(
+        reference_data=_frame(rng, 200), model_registry_path=str(tmp_path)
+    )
+    _, drift_detected, drift_score = detector.detect_drift(
+        _frame(rng, 200, shift=3.0),
+        column_mapping_override=COLUMN_MAPPING,
+        method="psi",
+    )
+    assert drift_detected
+    assert drift_score > drift_detection.PSI_THRESHOLD
+
+
+def test_drift_history_compaction_keeps_other_writers(tmp_path: Any) -> Any:
+    """Test that compacting the history log keeps lines from other detectors"""
+    first = DriftDetector(model_registry_path=str(tmp_path))
+    second = DriftDetector(model_registry_path=str(tmp_path))
+    for i in range(drift_detection.DRIFT_HISTORY_LIMIT):
+        first._save_drift_history(False, float(i), {"writer": "first"})
+        second._save_drift_history(False, float(i), {"writer": "second"})
+    history = DriftDetector(model_registry_path=str(tmp_path)).drift_history
+    writers = [entry["details"]["writer"] for entry in history]
+    assert len(history) == drift_detection.DRIFT_HISTORY_LIMIT
+    assert writers.count("first") == writers.count("second")
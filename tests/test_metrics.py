@@ -1,7 +1,8 @@
 import os
 import sys
 import unittest
-from unittest.mock import Mock, patch
+from typing import Any
+from unittest.mock import Mock, call, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from fluxora.core.metrics import MetricsCollector
@@ -35,15 +36,50 @@ class TestMetrics(unittest.TestCase):
         mock_histogram_instance.labels.return_value = mock_histogram_instance
         collector = MetricsCollector(service_name="test_service")
         collector.track_request(method="GET", endpoint="/test", status=200, latency=0.1)
-        mock_counter_instance.labels.assert_called_with(
-            method="GET", endpoint="/test", status=200
-        )
+        mock_counter_instance.labels.assert_called_with("GET", "/test", "200")
         mock_counter_instance.inc.assert_called_once()
-        mock_histogram_instance.labels.assert_called_with(
-            method="GET", endpoint="/test"
-        )
+        mock_histogram_instance.labels.assert_called_with("GET", "/test")
         mock_histogram_instance.observe.assert_called_with(0.1)
 
+    @patch("fluxora.core.metrics.Counter")
+    @patch("fluxora.core.metrics.Histogram")
+    def test_track_request_reuses_label_children(
+        self, mock_histogram: Any, mock_counter: Any
+    ) -> Any:
+        """Test that labels() is called once per distinct label combination"""
+        children = {}
+
+        def child(*labels: str) -> Mock:
+            return children.setdefault(labels, Mock())
+
+        mock_counter.return_value.labels.side_effect = child
+        mock_histogram.return_value.labels.side_effect = child
+        collector = MetricsCollector(service_name="test_service")
+        requests = [
+            ("GET", "/test", 200),
+            ("GET", "/test", 200),
+            ("GET", "/test", 500),
+            ("POST", "/test", 200),
+            ("GET", "/test", 500),
+            ("POST", "/test", 200),
+        ]
+        for method, endpoint, status in requests:
+            collector.track_request(method, endpoint, status, latency=0.1)
+        self.assertEqual(
+            mock_counter.return_value.labels.call_args_list,
+            [
+                call("GET", "/test", "200"),
+                call("GET", "/test", "500"),
+                call("POST", "/test", "200"),
+            ],
+        )
+        self.assertEqual(
+            mock_histogram.return_value.labels.call_args_list,
+            [call("GET", "/test"), call("POST", "/test")],
+        )
+        self.assertEqual(children[("GET", "/test", "500")].inc.call_count, 2)
+        self.assertEqual(children[("GET", "/test")].observe.call_count, 4)
+
     @patch("src.utils.metrics.Counter")
     def test_track_error(self, mock_counter: Any) -> Any:
         """Test that track_error increments the error counter"""
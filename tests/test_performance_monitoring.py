@@ -0,0 +1,321 @@
+"""
+Tests for the performance monitoring metrics in tools/monitoring.
+
+The fast regression and classification scorers and the class-count kernels
+are checked against sklearn, and the Numba kernel against its NumPy fallback.
+"""
+
+import importlib.util
+import logging
+import os
+import sys
+import threading
+from typing import Any
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    accuracy_score,
+    confusion_matrix,
+    f1_score,
+    mean_absolute_error,
+    mean_squared_error,
+    precision_score,
+    r2_score,
+    recall_score,
+)
+
+sys.path.insert(
+    0,
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "tools", "monitoring")
+    ),
+)
+import _metric_kernels
+
+# performance.py expects alerting and logger modules that are not part of this
+# tree; stand in for any that are missing while it is imported, then remove
+# the stand-ins so other modules still see them as missing.
+_STANDINS = {
+    name: stub
+    for name, stub in (
+        ("fluxora.core.alert_handler", Mock()),
+        ("fluxora.core.logger", Mock(get_logger=logging.getLogger)),
+    )
+    if importlib.util.find_spec(name) is None
+}
+sys.modules.update(_STANDINS)
+try:
+    import performance
+finally:
+    for name in _STANDINS:
+        del sys.modules[name]
+
+requires_numba = pytest.mark.skipif(
+    not _metric_kernels.NUMBA_AVAILABLE, reason="numba is not installed"
+)
+KERNELS = [
+    pytest.param("_class_counts_numpy", id="numpy"),
+    pytest.param("_class_counts_numba", id="numba", marks=requires_numba),
+]
+
+
+def _sklearn_classification(y_true: Any, y_pred: Any, average: str) -> Any:
+    return (
+        accuracy_score(y_true, y_pred),
+        precision_score(y_true, y_pred, average=average, zero_division=0),
+        recall_score(y_true, y_pred, average=average, zero_division=0),
+        f1_score(y_true, y_pred, average=average, zero_division=0),
+    )
+
+
+def _sklearn_regression(y_true: Any, y_pred: Any) -> Any:
+    mse = mean_squared_error(y_true, y_pred)
+    return (
+        mean_absolute_error(y_true, y_pred),
+        mse,
+        mse**0.5,
+        r2_score(y_true, y_pred),
+    )
+
+
+def _sample(metric: Any, labels: dict, suffix: str = "") -> float:
+    """Read one sample straight from a metric, whatever registry it is in."""
+    name = metric._name + suffix
+    for family in metric.collect():
+        for sample in family.samples:
+            if sample.name == name and sample.labels == labels:
+                return sample.value
+    return 0.0
+
+
+@pytest.fixture
+def rng() -> Any:
+    """Seeded random generator."""
+    return np.random.default_rng(7)
+
+
+@pytest.mark.parametrize(
+    "y_true,y_pred",
+    [
+        ([3, -0.5, 2, 7, 4.2], [2.5, 0.0, 2.1, 7.8, 4.0]),
+        ([1.0, 1.0, 1.0], [1.0, 1.0, 1.0]),
+        ([1.0, 1.0, 1.0], [0.0, 1.0, 2.0]),
+        ([[0.5, 1.0], [-1.0, 1.0], [7.0, -6.0]], [[0.0, 2.0], [-1.0, 2.0], [8, -5]]),
+    ],
+    ids=["1-d", "constant-exact", "constant-miss", "multi-output"],
+)
+def test_regression_scores_match_sklearn(y_true: Any, y_pred: Any) -> Any:
+    """Test MAE, MSE, RMSE and R2 against sklearn"""
+    np.testing.assert_allclose(
+        performance._regression_scores(y_true, y_pred),
+        _sklearn_regression(y_true, y_pred),
+        rtol=1e-12,
+    )
+
+
+def test_regression_scores_batch_match_sklearn(rng: Any) -> Any:
+    """Test the batched regression scores against sklearn per model"""
+    pairs = []
+    for n in (1, 5, 200):
+        y_true = rng.normal(size=n)
+        pairs.append((y_true, y_true + rng.normal(scale=0.3, size=n)))
+    expected = [_sklearn_regression(*pair) for pair in pairs[1:]]
+    scores = performance._regression_scores_batch(pairs)
+    np.testing.assert_allclose(scores[1:], expected, rtol=1e-10)
+    np.testing.assert_allclose(scores[0, :3], _sklearn_regression(*pairs[0])[:3])
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("average", performance.FAST_AVERAGES)
+@pytest.mark.parametrize("offset", [0, -3, 10**9])
+def test_classification_scores_match_sklearn(
+    rng: Any, monkeypatch: Any, kernel: str, average: str, offset: int
+) -> Any:
+    """Test accuracy, precision, recall and F1 against sklearn for each kernel"""
+    monkeypatch.setattr(
+        performance, "class_counts_kernel", getattr(_metric_kernels, kernel)
+    )
+    for n_classes, n in ((2, 50), (5, 300), (12, 40)):
+        y_true = rng.integers(0, n_classes, n) + offset
+        y_pred = rng.integers(0, n_classes + 1, n) + offset
+        np.testing.assert_allclose(
+            performance._classification_scores(y_true, y_pred, average),
+            _sklearn_classification(y_true, y_pred, average),
+            rtol=1e-12,
+        )
+
+
+def test_encode_labels_compacts_sparse_labels(rng: Any) -> Any:
+    """Test that labels spanning a wide range are encoded by distinct value"""
+    labels = np.array([-5, 0, performance.MAX_DENSE_LABEL_SPAN * 4])
+    y_true = rng.choice(labels, 100000)
+    y_pred = rng.choice(labels, 100000)
+    codes_true, codes_pred, n_classes = performance._encode_labels(y_true, y_pred)
+    assert n_classes == 3
+    np.testing.assert_array_equal(labels[codes_true], y_true)
+    np.testing.assert_array_equal(labels[codes_pred], y_pred)
+    np.testing.assert_allclose(
+        performance._classification_scores(y_true, y_pred, "macro"),
+        _sklearn_classification(y_true, y_pred, "macro"),
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize(
+    "y_true,y_pred",
+    [
+        (["cat", "dog", "dog"], ["cat", "cat", "dog"]),
+        ([[1, 0, 1], [0, 1, 0], [1, 1, 0]], [[1, 0, 0], [0, 1, 0], [0, 1, 1]]),
+    ],
+    ids=["string-labels", "multilabel"],
+)
+def test_classification_scores_fall_back_to_sklearn(y_true: Any, y_pred: Any) -> Any:
+    """Test that labels the kernel cannot encode are scored by sklearn"""
+    np.testing.assert_allclose(
+        performance._classification_scores(y_true, y_pred, "macro"),
+        _sklearn_classification(y_true, y_pred, "macro"),
+    )
+
+
+@pytest.mark.parametrize("average", performance.FAST_AVERAGES)
+def test_classification_scores_batch_match_sklearn(rng: Any, average: str) -> Any:
+    """Test the batched classification scores against sklearn per model"""
+    pairs = [
+        (rng.integers(0, k, n), rng.integers(0, k, n))
+        for k, n in ((2, 30), (4, 200), (3, 1))
+    ]
+    expected = [_sklearn_classification(*pair, average) for pair in pairs]
+    np.testing.assert_allclose(
+        performance._classification_scores_batch(pairs, average),
+        expected,
+        rtol=1e-12,
+    )
+
+
+def test_classification_scores_batch_multilabel_falls_back(rng: Any) -> Any:
+    """Test that multilabel indicator pairs are scored pair by pair"""
+    pairs = [(rng.integers(0, 2, (20, 3)), rng.integers(0, 2, (20, 3)))]
+    np.testing.assert_allclose(
+        performance._classification_scores_batch(pairs, "macro"),
+        [_sklearn_classification(*pairs[0], "macro")],
+    )
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("n_classes", [3, _metric_kernels.SMALL_N_CLASSES + 4])
+def test_class_counts_match_confusion_matrix(
+    rng: Any, kernel: str, n_classes: int
+) -> Any:
+    """Test per-class counts against the sums of sklearn's confusion matrix"""
+    y_true = rng.integers(0, n_classes, 2000).astype(np.int32)
+    y_pred = np.where(
+        rng.random(2000) < 0.6, y_true, rng.integers(0, n_classes, 2000)
+    ).astype(np.int32)
+    cm = confusion_matrix(y_true, y_pred, labels=np.arange(n_classes))
+    tp, n_true, n_pred = getattr(_metric_kernels, kernel)(y_true, y_pred, n_classes)
+    np.testing.assert_array_equal(tp, np.diagonal(cm))
+    np.testing.assert_array_equal(n_true, cm.sum(axis=1))
+    np.testing.assert_array_equal(n_pred, cm.sum(axis=0))
+
+
+@requires_numba
+def test_class_counts_numba_stays_within_budget(rng: Any, monkeypatch: Any) -> Any:
+    """Test the Numba counts when the budget allows a single chunk"""
+    monkeypatch.setattr(_metric_kernels, "LOCAL_COUNTS_BUDGET_BYTES", 1)
+    y_true = rng.integers(0, 1000, 5000).astype(np.int32)
+    y_pred = rng.integers(0, 1000, 5000).astype(np.int32)
+    for actual, expected in zip(
+        _metric_kernels._class_counts_numba(y_true, y_pred, 1000),
+        _metric_kernels._class_counts_numpy(y_true, y_pred, 1000),
+    ):
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_memoized_scores_rescore_buffers_refilled_in_place() -> Any:
+    """Test that refilling an input buffer in place is not served from the memo"""
+    y_true = np.arange(10.0)
+    y_pred = y_true + 2.0
+
+    def compute() -> Any:
+        return performance._regression_scores(y_true, y_pred)
+
+    first = performance._memoized_scores("test", y_true, y_pred, compute)
+    y_pred[:] = y_true
+    second = performance._memoized_scores("test", y_true, y_pred, compute)
+    assert first[0] == pytest.approx(2.0)
+    assert second[0] == 0.0
+
+
+def test_memoized_scores_under_concurrent_eviction(rng: Any) -> Any:
+    """Test that threads evicting each other's entries still get their scores"""
+    pairs = [
+        (rng.integers(0, 3, n), rng.integers(0, 3, n))
+        for n in range(1, 2 * performance.SCORE_CACHE_SIZE + 1)
+    ]
+    expected = [performance._classification_scores(*pair, "macro") for pair in pairs]
+    mismatches = []
+
+    def score_all() -> None:
+        for _ in range(20):
+            for pair, scores in zip(pairs, expected):
+                result = performance._memoized_scores(
+                    "classification:macro",
+                    *pair,
+                    lambda: performance._classification_scores(*pair, "macro"),
+                )
+                if result != scores:
+                    mismatches.append(result)
+
+    workers = [threading.Thread(target=score_all) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert mismatches == []
+
+
+def test_request_metrics_flush_idle_and_exited_threads() -> Any:
+    """Test that flush publishes other threads' updates and drops dead buffers"""
+    batches = performance._BatchedMetrics(batch_size=1000, flush_interval=60.0)
+    labels = {"endpoint": "/flush-test", "method": "GET", "status_code": "2xx"}
+    before = _sample(performance.API_REQUESTS_TOTAL, labels, "_total")
+    workers = [
+        threading.Thread(
+            target=batches.record, args=("/flush-test", "GET", "2xx", 0.01)
+        )
+        for _ in range(5)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    batches.flush()
+    assert _sample(performance.API_REQUESTS_TOTAL, labels, "_total") == before + 5
+    assert batches._buffers == []
+
+
+@pytest.mark.parametrize(
+    "status_code,bucket",
+    [
+        (200, "2xx"),
+        (304, "3xx"),
+        ("404", "4xx"),
+        (503, "5xx"),
+        (99, "other"),
+        (600, "other"),
+        ("junk", "other"),
+        (None, "other"),
+    ],
+)
+def test_status_bucket(status_code: Any, bucket: str) -> Any:
+    """Test that status codes, valid or not, map onto a fixed set of labels"""
+    assert performance._status_bucket(status_code) == bucket
+
+
+def test_update_api_request_metrics_logs_invalid_latency() -> Any:
+    """Test that a non-numeric latency is logged on its own call"""
+    with patch.object(performance.logger, "error") as mock_error:
+        performance.update_api_request_metrics("/invalid", "GET", 200, "slow")
+    mock_error.assert_called_once()
@@ -0,0 +1,126 @@
+import os
+import sys
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any
+from unittest.mock import Mock, call, patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("opentelemetry.exporter.jaeger.thrift")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from fluxora.core import tracing
+from fluxora.core.tracing import TracingManager
+
+OTLP_MODULE = "opentelemetry.exporter.otlp.proto.grpc.trace_exporter"
+
+
+class Priority(IntEnum):
+    HIGH = 1
+
+
+def _manager(recording: bool = True) -> Any:
+    """Build a manager whose tracer hands out one mock span"""
+    span = Mock()
+    span.is_recording.return_value = recording
+
+    @contextmanager
+    def start_as_current_span(name: str) -> Any:
+        yield span
+
+    manager = TracingManager.__new__(TracingManager)
+    manager.tracer = Mock(start_as_current_span=start_as_current_span)
+    return manager, span
+
+
+def test_trace_function_sets_native_attributes() -> Any:
+    """Test that primitive arguments are recorded with their own types"""
+    manager, span = _manager()
+
+    @manager.trace_function()
+    def predict(*args: Any, **kwargs: Any) -> str:
+        return "ok"
+
+    assert predict("model", 3, 0.5, True, [1], threshold=0.9) == "ok"
+    assert span.set_attribute.call_args_list == [
+        call("arg_0", "model"),
+        call("arg_1", 3),
+        call("arg_2", 0.5),
+        call("arg_3", True),
+        call("kwarg_threshold", 0.9),
+    ]
+
+
+def test_trace_function_skips_attributes_when_not_recording() -> Any:
+    """Test that unsampled spans get no attributes but still record errors"""
+    manager, span = _manager(recording=False)
+    error = ValueError("bad input")
+
+    @manager.trace_function(name="failing")
+    def failing(value: int) -> None:
+        raise error
+
+    with pytest.raises(ValueError):
+        failing(1)
+    span.set_attribute.assert_not_called()
+    span.record_exception.assert_called_once_with(error)
+    span.set_status.assert_called_once()
+
+
+def test_trace_function_skips_primitive_subclasses() -> Any:
+    """Test that subclasses of primitive types are not recorded"""
+    manager, span = _manager()
+
+    @manager.trace_function()
+    def score(*args: Any) -> None:
+        return None
+
+    score(Priority.HIGH, np.float64(0.5), 7)
+    assert span.set_attribute.call_args_list == [call("arg_2", 7)]
+
+
+@pytest.fixture
+def jaeger_exporter() -> Any:
+    """Patch out the Jaeger exporter and the global tracer provider"""
+    with patch.object(tracing, "JaegerExporter") as exporter, patch.object(
+        tracing, "trace"
+    ):
+        yield exporter
+
+
+def test_batch_span_processor_sizing(jaeger_exporter: Any) -> Any:
+    """Test that spans are exported through a tuned BatchSpanProcessor"""
+    with patch.object(tracing, "BatchSpanProcessor") as processor:
+        TracingManager("test_service", jaeger_host="localhost", jaeger_port=6831)
+    jaeger_exporter.assert_called_once_with(
+        agent_host_name="localhost", agent_port=6831
+    )
+    processor.assert_called_once_with(
+        jaeger_exporter.return_value,
+        max_queue_size=8192,
+        max_export_batch_size=1024,
+        schedule_delay_millis=1000,
+    )
+
+
+def test_otlp_exporter_selected_by_env(jaeger_exporter: Any, monkeypatch: Any) -> Any:
+    """Test that OTEL_TRACES_EXPORTER=otlp selects the OTLP exporter"""
+    otlp_module = Mock()
+    monkeypatch.setitem(sys.modules, OTLP_MODULE, otlp_module)
+    monkeypatch.setenv("OTEL_TRACES_EXPORTER", "OTLP")
+    exporter = TracingManager._create_exporter("localhost", 6831)
+    assert exporter is otlp_module.OTLPSpanExporter.return_value
+    jaeger_exporter.assert_not_called()
+
+
+def test_otlp_exporter_missing_falls_back_to_jaeger(
+    jaeger_exporter: Any, monkeypatch: Any
+) -> Any:
+    """Test that a missing OTLP exporter package falls back to Jaeger"""
+    monkeypatch.setitem(sys.modules, OTLP_MODULE, None)
+    monkeypatch.setenv("OTEL_TRACES_EXPORTER", "otlp")
+    with patch.object(tracing.logger, "warning") as mock_warning:
+        exporter = TracingManager._create_exporter("localhost", 6831)
+    assert exporter is jaeger_exporter.return_value
+    mock_warning.assert_called_once()
@@ -3,6 +3,8 @@ import sys
 import unittest
 from unittest.mock import Mock
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from fluxora.core.transaction_coordinator import (
     TransactionCoordinator,
@@ -11,6 +13,19 @@ from fluxora.core.transaction_coordinator import (
 )
 
 
+def _participant(prepare: bool = True) -> Mock:
+    """Build a participant mock with all protocol methods configured at once"""
+    participant = Mock(spec_set=TransactionParticipant)
+    participant.configure_mock(
+        **{
+            "prepare.return_value": prepare,
+            "commit.return_value": True,
+            "abort.return_value": True,
+        }
+    )
+    return participant
+
+
 class TestTransactionCoordinator(unittest.TestCase):
 
     def setUp(self) -> Any:
@@ -26,55 +41,50 @@ class TestTransactionCoordinator(unittest.TestCase):
     def test_register_participant(self) -> Any:
         """Test that register_participant adds a participant to the transaction"""
         transaction_id = self.coordinator.create_transaction()
-        participant = Mock(spec=TransactionParticipant)
-        participant.prepare.return_value = True
-        participant.commit.return_value = True
-        participant.abort.return_value = True
+        participant = _participant()
         self.coordinator.register_participant(transaction_id, participant)
         self.assertIn(transaction_id, self.coordinator.transactions)
         self.assertIn(
             participant, self.coordinator.transactions[transaction_id]["participants"]
         )
 
-    def test_prepare_transaction_success(self) -> Any:
-        """Test that prepare_transaction prepares all participants"""
+    def test_prepare_transaction_batches_by_host(self) -> Any:
+        """Test that participants on the same host are prepared in one batch"""
         transaction_id = self.coordinator.create_transaction()
         participant1 = Mock(spec=TransactionParticipant)
-        participant1.prepare.return_value = True
-        participant1.commit.return_value = True
-        participant1.abort.return_value = True
+        participant1.host = "node-a"
+        participant1.batch_prepare.return_value = [True, True]
         participant2 = Mock(spec=TransactionParticipant)
-        participant2.prepare.return_value = True
-        participant2.commit.return_value = True
-        participant2.abort.return_value = True
-        self.coordinator.register_participant(transaction_id, participant1)
-        self.coordinator.register_participant(transaction_id, participant2)
+        participant2.host = "node-a"
+        participant3 = Mock(spec=TransactionParticipant)
+        participant3.prepare.return_value = True
+        for participant in (participant1, participant2, participant3):
+            self.coordinator.register_participant(transaction_id, participant)
         result = self.coordinator.prepare_transaction(transaction_id)
         self.assertTrue(result)
-        participant1.prepare.assert_called_once_with(transaction_id)
-        participant2.prepare.assert_called_once_with(transaction_id)
+        participant1.batch_prepare.assert_called_once_with(
+            [transaction_id, transaction_id], [participant1, participant2]
+        )
+        participant1.prepare.assert_not_called()
+        participant2.prepare.assert_not_called()
+        participant3.prepare.assert_called_once_with(transaction_id)
         self.assertEqual(
             self.coordinator.transactions[transaction_id]["status"],
             TransactionStatus.PREPARED,
         )
 
-    def test_prepare_transaction_failure(self) -> Any:
-        """Test that prepare_transaction aborts if any participant fails to prepare"""
+    def test_prepare_transaction_rejects_short_batch_result(self) -> Any:
+        """Test that a batch result missing participants aborts the prepare"""
         transaction_id = self.coordinator.create_transaction()
         participant1 = Mock(spec=TransactionParticipant)
-        participant1.prepare.return_value = True
-        participant1.commit.return_value = True
-        participant1.abort.return_value = True
+        participant1.host = "node-a"
+        participant1.batch_prepare.return_value = [True]
         participant2 = Mock(spec=TransactionParticipant)
-        participant2.prepare.return_value = False
-        participant2.commit.return_value = True
-        participant2.abort.return_value = True
-        self.coordinator.register_participant(transaction_id, participant1)
-        self.coordinator.register_participant(transaction_id, participant2)
+        participant2.host = "node-a"
+        for participant in (participant1, participant2):
+            self.coordinator.register_participant(transaction_id, participant)
         result = self.coordinator.prepare_transaction(transaction_id)
         self.assertFalse(result)
-        participant1.prepare.assert_called_once_with(transaction_id)
-        participant2.prepare.assert_called_once_with(transaction_id)
         participant1.abort.assert_called_once_with(transaction_id)
         participant2.abort.assert_called_once_with(transaction_id)
         self.assertEqual(
@@ -82,38 +92,10 @@ class TestTransactionCoordinator(unittest.TestCase):
             TransactionStatus.ABORTED,
         )
 
-    def test_commit_transaction_success(self) -> Any:
-        """Test that commit_transaction commits all participants"""
-        transaction_id = self.coordinator.create_transaction()
-        participant1 = Mock(spec=TransactionParticipant)
-        participant1.prepare.return_value = True
-        participant1.commit.return_value = True
-        participant1.abort.return_value = True
-        participant2 = Mock(spec=TransactionParticipant)
-        participant2.prepare.return_value = True
-        participant2.commit.return_value = True
-        participant2.abort.return_value = True
-        self.coordinator.register_participant(transaction_id, participant1)
-        self.coordinator.register_participant(transaction_id, participant2)
-        self.coordinator.transactions[transaction_id][
-            "status"
-        ] = TransactionStatus.PREPARED
-        result = self.coordinator.commit_transaction(transaction_id)
-        self.assertTrue(result)
-        participant1.commit.assert_called_once_with(transaction_id)
-        participant2.commit.assert_called_once_with(transaction_id)
-        self.assertEqual(
-            self.coordinator.transactions[transaction_id]["status"],
-            TransactionStatus.COMMITTED,
-        )
-
     def test_commit_transaction_not_prepared(self) -> Any:
         """Test that commit_transaction fails if the transaction is not prepared"""
         transaction_id = self.coordinator.create_transaction()
-        participant = Mock(spec=TransactionParticipant)
-        participant.prepare.return_value = True
-        participant.commit.return_value = True
-        participant.abort.return_value = True
+        participant = _participant()
         self.coordinator.register_participant(transaction_id, participant)
         result = self.coordinator.commit_transaction(transaction_id)
         self.assertFalse(result)
@@ -123,28 +105,31 @@ class TestTransactionCoordinator(unittest.TestCase):
             TransactionStatus.CREATED,
         )
 
-    def test_abort_transaction(self) -> Any:
-        """Test that abort_transaction aborts all participants"""
+    def test_execute_single_participant_fast_path(self) -> Any:
+        """Test that a lone single-phase participant is committed without prepare"""
         transaction_id = self.coordinator.create_transaction()
-        participant1 = Mock(spec=TransactionParticipant)
-        participant1.prepare.return_value = True
-        participant1.commit.return_value = True
-        participant1.abort.return_value = True
-        participant2 = Mock(spec=TransactionParticipant)
-        participant2.prepare.return_value = True
-        participant2.commit.return_value = True
-        participant2.abort.return_value = True
-        self.coordinator.register_participant(transaction_id, participant1)
-        self.coordinator.register_participant(transaction_id, participant2)
-        result = self.coordinator.abort_transaction(transaction_id)
+        participant = _participant()
+        participant.supports_single_phase = True
+        self.coordinator.register_participant(transaction_id, participant)
+        result = self.coordinator.execute_transaction(transaction_id)
         self.assertTrue(result)
-        participant1.abort.assert_called_once_with(transaction_id)
-        participant2.abort.assert_called_once_with(transaction_id)
+        participant.prepare.assert_not_called()
+        participant.commit.assert_called_once_with(transaction_id)
         self.assertEqual(
             self.coordinator.transactions[transaction_id]["status"],
-            TransactionStatus.ABORTED,
+            TransactionStatus.COMMITTED,
         )
 
+    def test_execute_single_participant_without_capability(self) -> Any:
+        """Test that a lone participant without the flag still runs both phases"""
+        transaction_id = self.coordinator.create_transaction()
+        participant = _participant()
+        self.coordinator.register_participant(transaction_id, participant)
+        result = self.coordinator.execute_transaction(transaction_id)
+        self.assertTrue(result)
+        participant.prepare.assert_called_once_with(transaction_id)
+        participant.commit.assert_called_once_with(transaction_id)
+
     def test_get_transaction_status(self) -> Any:
         """Test that get_transaction_status returns the correct status"""
         transaction_id = self.coordinator.create_transaction()
@@ -156,60 +141,126 @@ class TestTransactionCoordinator(unittest.TestCase):
         status = self.coordinator.get_transaction_status(transaction_id)
         self.assertEqual(status, TransactionStatus.PREPARED)
 
+    def test_find_stuck_transactions(self) -> Any:
+        """Test that find_stuck_transactions only returns old PREPARED transactions"""
+        stuck_id = self.coordinator.create_transaction()
+        fresh_id = self.coordinator.create_transaction()
+        for transaction_id in (stuck_id, fresh_id):
+            self.coordinator.register_participant(transaction_id, _participant())
+            self.assertTrue(self.coordinator.prepare_transaction(transaction_id))
+        self.coordinator.transactions[stuck_id]["prepared_at"] -= 120
+        self.assertEqual(self.coordinator.find_stuck_transactions(60), [stuck_id])
+
+    def test_find_stuck_transactions_uses_prepare_time(self) -> Any:
+        """Test that an old transaction prepared just now is not reported stuck"""
+        transaction_id = self.coordinator.create_transaction()
+        self.coordinator.transactions[transaction_id]["created_at"] -= 120
+        self.coordinator.register_participant(transaction_id, _participant())
+        self.assertTrue(self.coordinator.prepare_transaction(transaction_id))
+        self.assertEqual(self.coordinator.find_stuck_transactions(60), [])
+
     def test_get_transaction_status_invalid_id(self) -> Any:
         """Test that get_transaction_status returns None for invalid transaction ID"""
         status = self.coordinator.get_transaction_status("invalid_id")
         self.assertIsNone(status)
 
-    def test_execute_transaction_success(self) -> Any:
-        """Test that execute_transaction successfully executes a transaction"""
-        transaction_id = self.coordinator.create_transaction()
-        participant1 = Mock(spec=TransactionParticipant)
-        participant1.prepare.return_value = True
-        participant1.commit.return_value = True
-        participant1.abort.return_value = True
-        participant2 = Mock(spec=TransactionParticipant)
-        participant2.prepare.return_value = True
-        participant2.commit.return_value = True
-        participant2.abort.return_value = True
-        self.coordinator.register_participant(transaction_id, participant1)
-        self.coordinator.register_participant(transaction_id, participant2)
-        result = self.coordinator.execute_transaction(transaction_id)
-        self.assertTrue(result)
-        participant1.prepare.assert_called_once_with(transaction_id)
-        participant2.prepare.assert_called_once_with(transaction_id)
-        participant1.commit.assert_called_once_with(transaction_id)
-        participant2.commit.assert_called_once_with(transaction_id)
-        self.assertEqual(
-            self.coordinator.transactions[transaction_id]["status"],
-            TransactionStatus.COMMITTED,
-        )
 
-    def test_execute_transaction_prepare_failure(self) -> Any:
-        """Test that execute_transaction aborts if prepare fails"""
-        transaction_id = self.coordinator.create_transaction()
-        participant1 = Mock(spec=TransactionParticipant)
-        participant1.prepare.return_value = True
-        participant1.commit.return_value = True
-        participant1.abort.return_value = True
-        participant2 = Mock(spec=TransactionParticipant)
-        participant2.prepare.return_value = False
-        participant2.commit.return_value = True
-        participant2.abort.return_value = True
-        self.coordinator.register_participant(transaction_id, participant1)
-        self.coordinator.register_participant(transaction_id, participant2)
-        result = self.coordinator.execute_transaction(transaction_id)
-        self.assertFalse(result)
-        participant1.prepare.assert_called_once_with(transaction_id)
-        participant2.prepare.assert_called_once_with(transaction_id)
-        participant1.abort.assert_called_once_with(transaction_id)
-        participant2.abort.assert_called_once_with(transaction_id)
-        participant1.commit.assert_not_called()
-        participant2.commit.assert_not_called()
-        self.assertEqual(
-            self.coordinator.transactions[transaction_id]["status"],
+@pytest.fixture
+def coordinator() -> Any:
+    """Create a fresh transaction coordinator."""
+    return TransactionCoordinator()
+
+
+@pytest.mark.parametrize(
+    "op,p2_prepare,initial_status,expected,expected_status,called,not_called",
+    [
+        pytest.param(
+            "prepare_transaction",
+            True,
+            None,
+            True,
+            TransactionStatus.PREPARED,
+            ("prepare",),
+            (),
+            id="prepare-success",
+        ),
+        pytest.param(
+            "prepare_transaction",
+            False,
+            None,
+            False,
             TransactionStatus.ABORTED,
-        )
+            ("prepare", "abort"),
+            (),
+            id="prepare-failure",
+        ),
+        pytest.param(
+            "commit_transaction",
+            True,
+            TransactionStatus.PREPARED,
+            True,
+            TransactionStatus.COMMITTED,
+            ("commit",),
+            (),
+            id="commit-success",
+        ),
+        pytest.param(
+            "abort_transaction",
+            True,
+            None,
+            True,
+            TransactionStatus.ABORTED,
+            ("abort",),
+            (),
+            id="abort",
+        ),
+        pytest.param(
+            "execute_transaction",
+            True,
+            None,
+            True,
+            TransactionStatus.COMMITTED,
+            ("prepare", "commit"),
+            (),
+            id="execute-success",
+        ),
+        pytest.param(
+            "execute_transaction",
+            False,
+            None,
+            False,
+            TransactionStatus.ABORTED,
+            ("prepare", "abort"),
+            ("commit",),
+            id="execute-prepare-failure",
+        ),
+    ],
+)
+def test_2pc_flow(
+    coordinator: Any,
+    op: str,
+    p2_prepare: bool,
+    initial_status: Any,
+    expected: bool,
+    expected_status: TransactionStatus,
+    called: Any,
+    not_called: Any,
+) -> Any:
+    """Test a two-participant transaction through each coordinator operation"""
+    transaction_id = coordinator.create_transaction()
+    participants = (_participant(), _participant(prepare=p2_prepare))
+    for participant in participants:
+        coordinator.register_participant(transaction_id, participant)
+    if initial_status is not None:
+        coordinator.transactions[transaction_id]["status"] = initial_status
+    result = getattr(coordinator, op)(transaction_id)
+    assert result is expected
+    for participant in participants:
+        for method in called:
+            getattr(participant, method).assert_called_once_with(transaction_id)
+        for method in not_called:
+            getattr(participant, method).assert_not_called()
+    assert coordinator.transactions[transaction_id]["status"] == expected_status
 
 
 if __name__ == "__main__":
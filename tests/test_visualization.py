@@ -2,32 +2,68 @@
 Tests for visualization components.
 """
 
+import importlib
+from typing import Any
+
 import numpy as np
 import pandas as pd
 import pytest
-from fluxora.visualization.charts import (
-    create_bar_chart,
-    create_heatmap,
-    create_line_chart,
-    create_scatter_plot,
-)
 
+pytestmark = pytest.mark.visualization
 
-@pytest.fixture
-def time_series_data() -> Any:
-    """Create sample time series data."""
+_TS_INDEX = pd.date_range(start="2024-01-01", periods=10, freq="h")
+_rng = np.random.default_rng()
+
+EXPORT_CHARTS = {
+    "line": dict(x="timestamp", y="value", title="Export Test"),
+}
+
+
+def _assert_nonempty(chart: Any) -> None:
+    assert chart is not None and chart.data
+
+
+@pytest.fixture(scope="module")
+def charts() -> Any:
+    """Import the chart factories only when visualization tests are selected."""
+    return importlib.import_module("fluxora.visualization.charts")
+
+
+@pytest.fixture(scope="session")
+def _time_series_data_cached() -> pd.DataFrame:
     return pd.DataFrame(
         {
-            "timestamp": pd.date_range(start="2024-01-01", periods=10, freq="H"),
-            "value": np.random.normal(100, 10, 10),
+            "timestamp": _TS_INDEX,
+            "value": _rng.normal(100, 10, 10),
             "category": ["A", "B"] * 5,
         }
     )
 
 
 @pytest.fixture
-def categorical_data() -> Any:
-    """Create sample categorical data."""
+def time_series_data(_time_series_data_cached: pd.DataFrame) -> Any:
+    """Create sample time series data."""
+    return _time_series_data_cached.copy(deep=False)
+
+
+@pytest.fixture(scope="module")
+def exported_charts(charts: Any, _time_series_data_cached: pd.DataFrame) -> Any:
+    """
+    Build every chart in EXPORT_CHARTS and render them to PNG in one pass,
+    so the Kaleido renderer is started once per module instead of per test.
+    """
+    data = _time_series_data_cached.copy(deep=False)
+    built = {
+        name: charts.create_line_chart(data=data, **kwargs)
+        for name, kwargs in EXPORT_CHARTS.items()
+    }
+    return {
+        name: (chart, chart.to_image(format="png")) for name, chart in built.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def _categorical_data_cached() -> pd.DataFrame:
     return pd.DataFrame(
         {
             "category": ["A", "B", "C", "D"],
@@ -38,55 +74,63 @@ def categorical_data() -> Any:
 
 
 @pytest.fixture
-def correlation_data() -> Any:
-    """Create sample correlation data."""
+def categorical_data(_categorical_data_cached: pd.DataFrame) -> Any:
+    """Create sample categorical data."""
+    return _categorical_data_cached.copy(deep=False)
+
+
+@pytest.fixture(scope="session")
+def _correlation_data_cached() -> pd.DataFrame:
     return pd.DataFrame(
         {
-            "var1": np.random.normal(0, 1, 100),
-            "var2": np.random.normal(0, 1, 100),
-            "var3": np.random.normal(0, 1, 100),
+            "var1": _rng.normal(0, 1, 100),
+            "var2": _rng.normal(0, 1, 100),
+            "var3": _rng.normal(0, 1, 100),
         }
     )
 
 
-def test_create_line_chart(time_series_data: Any) -> Any:
+@pytest.fixture
+def correlation_data(_correlation_data_cached: pd.DataFrame) -> Any:
+    """Create sample correlation data."""
+    return _correlation_data_cached.copy(deep=False)
+
+
+def test_create_line_chart(time_series_data: Any, charts: Any) -> Any:
     """Test line chart creation."""
-    chart = create_line_chart(
+    chart = charts.create_line_chart(
         data=time_series_data, x="timestamp", y="value", title="Test Line Chart"
     )
-    assert chart is not None
+    _assert_nonempty(chart)
     assert chart.title == "Test Line Chart"
-    assert len(chart.data) > 0
 
 
-def test_create_line_chart_with_missing_data() -> Any:
+def test_create_line_chart_with_missing_data(charts: Any) -> Any:
     """Test line chart creation with missing data."""
     data = pd.DataFrame(
         {
-            "timestamp": pd.date_range(start="2024-01-01", periods=5, freq="H"),
+            "timestamp": pd.date_range(start="2024-01-01", periods=5, freq="h"),
             "value": [1, np.nan, 3, np.nan, 5],
         }
     )
-    chart = create_line_chart(
+    chart = charts.create_line_chart(
         data=data, x="timestamp", y="value", title="Line Chart with Missing Data"
     )
-    assert chart is not None
-    assert len(chart.data) > 0
+    _assert_nonempty(chart)
 
 
-def test_create_bar_chart(categorical_data: Any) -> Any:
+def test_create_bar_chart(categorical_data: Any, charts: Any) -> Any:
     """Test bar chart creation."""
-    chart = create_bar_chart(
+    chart = charts.create_bar_chart(
         data=categorical_data, x="category", y="value", title="Test Bar Chart"
     )
-    assert chart is not None
+    _assert_nonempty(chart)
     assert chart.title == "Test Bar Chart"
-    assert len(chart.data) > 0
 
 
-def test_create_bar_chart_with_grouping(categorical_data: Any) -> Any:
+def test_create_bar_chart_with_grouping(categorical_data: Any, charts: Any) -> Any:
     """Test grouped bar chart creation."""
-    chart = create_bar_chart(
+    chart = charts.create_bar_chart(
         data=categorical_data,
         x="category",
         y="value",
@@ -97,53 +141,47 @@ def test_create_bar_chart_with_grouping(categorical_data: Any) -> Any:
     assert len(chart.data) > 1
 
 
-def test_create_heatmap(correlation_data: Any) -> Any:
+def test_create_heatmap(correlation_data: Any, charts: Any) -> Any:
     """Test heatmap creation."""
-    chart = create_heatmap(data=correlation_data, title="Correlation Heatmap")
-    assert chart is not None
+    chart = charts.create_heatmap(data=correlation_data, title="Correlation Heatmap")
+    _assert_nonempty(chart)
     assert chart.title == "Correlation Heatmap"
-    assert len(chart.data) > 0
 
 
-def test_create_heatmap_with_custom_colors(correlation_data: Any) -> Any:
+def test_create_heatmap_with_custom_colors(correlation_data: Any, charts: Any) -> Any:
     """Test heatmap creation with custom colors."""
-    chart = create_heatmap(
+    chart = charts.create_heatmap(
         data=correlation_data, title="Custom Heatmap", colorscale="Viridis"
     )
     assert chart is not None
     assert chart.colorscale == "Viridis"
 
 
-def test_create_scatter_plot(correlation_data: Any) -> Any:
+def test_create_scatter_plot(correlation_data: Any, charts: Any) -> Any:
     """Test scatter plot creation."""
-    chart = create_scatter_plot(
+    chart = charts.create_scatter_plot(
         data=correlation_data, x="var1", y="var2", title="Scatter Plot"
     )
-    assert chart is not None
+    _assert_nonempty(chart)
     assert chart.title == "Scatter Plot"
-    assert len(chart.data) > 0
 
 
-def test_create_scatter_plot_with_color(correlation_data: Any) -> Any:
+def test_create_scatter_plot_with_color(correlation_data: Any, charts: Any) -> Any:
     """Test scatter plot with color encoding."""
-    chart = create_scatter_plot(
+    chart = charts.create_scatter_plot(
         data=correlation_data,
         x="var1",
         y="var2",
         color="var3",
         title="Colored Scatter Plot",
     )
-    assert chart is not None
-    assert len(chart.data) > 0
+    _assert_nonempty(chart)
 
 
 @pytest.mark.integration
-def test_chart_export(time_series_data: Any) -> Any:
+def test_chart_export(exported_charts: Any) -> Any:
     """Test chart export functionality."""
-    chart = create_line_chart(
-        data=time_series_data, x="timestamp", y="value", title="Export Test"
-    )
-    png_data = chart.to_image(format="png")
+    chart, png_data = exported_charts["line"]
     assert png_data is not None
     assert len(png_data) > 0
     html_data = chart.to_html()
@@ -151,9 +189,9 @@ def test_chart_export(time_series_data: Any) -> Any:
     assert "plotly" in html_data
 
 
-def test_chart_customization(time_series_data: Any) -> Any:
+def test_chart_customization(time_series_data: Any, charts: Any) -> Any:
     """Test chart customization options."""
-    chart = create_line_chart(
+    chart = charts.create_line_chart(
         data=time_series_data,
         x="timestamp",
         y="value",
@@ -168,11 +206,11 @@ def test_chart_customization(time_series_data: Any) -> Any:
     assert chart.layout.template == "plotly_dark"
 
 
-def test_chart_error_handling() -> Any:
+def test_chart_error_handling(charts: Any) -> Any:
     """Test chart error handling."""
     with pytest.raises(ValueError):
-        create_line_chart(data=pd.DataFrame(), x="timestamp", y="value")
+        charts.create_line_chart(data=pd.DataFrame(), x="timestamp", y="value")
     with pytest.raises(KeyError):
-        create_line_chart(data=time_series_data, x="nonexistent", y="value")
+        charts.create_line_chart(data=time_series_data, x="nonexistent", y="value")
     with pytest.raises(TypeError):
-        create_line_chart(data=time_series_data, x="timestamp", y="category")
+        charts.create_line_chart(data=time_series_data, x="timestamp", y="category")
@@ -0,0 +1,174 @@
+"""
+Column-parallel drift kernels for the drift detector.
+
+Per-feature reference data is packed into flat arrays with offsets so one
+monomorphic kernel can score every feature: the inner bin edges of feature
+``i`` are ``edges_flat[edges_offsets[i]:edges_offsets[i + 1]]`` and, since a
+feature with ``k`` inner edges has ``k + 1`` bins, its reference bin
+probabilities start at ``edges_offsets[i] + i`` in ``ref_probs_flat``.
+
+The streaming kernels update per-feature Welford moments and bin counts
+in place, with the bin counts laid out like ``ref_probs_flat``.
+
+Numba is optional; without it the same computation runs through NumPy.
+"""
+
+import os
+import sys
+from typing import List, Tuple
+
+import numpy as np
+
+if sys.platform == "darwin":
+    os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+PROB_EPSILON = 1e-06
+
+
+def pack_edges(
+    edges: List[np.ndarray], ref_probs: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pack per-feature bin edges and reference probabilities into flat arrays.
+
+    Returns:
+        Tuple of (edges_flat, edges_offsets, ref_probs_flat)
+    """
+    offsets = np.zeros(len(edges) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([e.size for e in edges])
+    edges_flat = np.concatenate(edges) if edges else np.empty(0)
+    probs_flat = np.concatenate(ref_probs) if ref_probs else np.empty(0)
+    return (
+        edges_flat.astype(np.float64),
+        offsets,
+        probs_flat.astype(np.float64),
+    )
+
+
+def _psi_numpy(
+    cur_mat: np.ndarray,
+    edges_flat: np.ndarray,
+    edges_offsets: np.ndarray,
+    ref_probs_flat: np.ndarray,
+) -> np.ndarray:
+    n_features = cur_mat.shape[0]
+    out = np.empty(n_features)
+    for i in range(n_features):
+        e0, e1 = edges_offsets[i], edges_offsets[i + 1]
+        edges = edges_flat[e0:e1]
+        ref_probs = ref_probs_flat[e0 + i : e1 + i + 1]
+        row = cur_mat[i]
+        row = row[~np.isnan(row)]
+        counts = np.bincount(
+            np.searchsorted(edges, row, side="right"), minlength=edges.size + 1
+        )
+        cur_probs = counts / max(row.size, 1) + PROB_EPSILON
+        out[i] = np.sum((cur_probs - ref_probs) * np.log(cur_probs / ref_probs))
+    return out
+
+
+def _stream_update_numpy(
+    cur_mat: np.ndarray,
+    edges_flat: np.ndarray,
+    edges_offsets: np.ndarray,
+    count: np.ndarray,
+    mean: np.ndarray,
+    m2: np.ndarray,
+    hist_flat: np.ndarray,
+) -> None:
+    for i in range(cur_mat.shape[0]):
+        e0, e1 = edges_offsets[i], edges_offsets[i + 1]
+        row = cur_mat[i]
+        row = row[~np.isnan(row)]
+        n_b = row.size
+        if n_b == 0:
+            continue
+        hist_flat[e0 + i : e1 + i + 1] += np.bincount(
+            np.searchsorted(edges_flat[e0:e1], row, side="right"),
+            minlength=e1 - e0 + 1,
+        )
+        mean_b = row.mean()
+        n = count[i] + n_b
+        delta = mean_b - mean[i]
+        mean[i] += delta * n_b / n
+        m2[i] += np.sum((row - mean_b) ** 2) + delta * delta * count[i] * n_b / n
+        count[i] = n
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _psi_numba(
+        cur_mat: np.ndarray,
+        edges_flat: np.ndarray,
+        edges_offsets: np.ndarray,
+        ref_probs_flat: np.ndarray,
+    ) -> np.ndarray:
+        n_features = cur_mat.shape[0]
+        out = np.empty(n_features)
+        for i in prange(n_features):
+            e0 = edges_offsets[i]
+            e1 = edges_offsets[i + 1]
+            edges = edges_flat[e0:e1]
+            n_bins = e1 - e0 + 1
+            counts = np.zeros(n_bins)
+            total = 0.0
+            row = cur_mat[i]
+            for j in range(row.shape[0]):
+                value = row[j]
+                if np.isnan(value):
+                    continue
+                counts[np.searchsorted(edges, value, side="right")] += 1.0
+                total += 1.0
+            if total == 0.0:
+                total = 1.0
+            psi = 0.0
+            for b in range(n_bins):
+                ref_p = ref_probs_flat[e0 + i + b]
+                cur_p = counts[b] / total + PROB_EPSILON
+                psi += (cur_p - ref_p) * np.log(cur_p / ref_p)
+            out[i] = psi
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _stream_update_numba(
+        cur_mat: np.ndarray,
+        edges_flat: np.ndarray,
+        edges_offsets: np.ndarray,
+        count: np.ndarray,
+        mean: np.ndarray,
+        m2: np.ndarray,
+        hist_flat: np.ndarray,
+    ) -> None:
+        for i in prange(cur_mat.shape[0]):
+            e0 = edges_offsets[i]
+            e1 = edges_offsets[i + 1]
+            edges = edges_flat[e0:e1]
+            n = count[i]
+            mu = mean[i]
+            acc = m2[i]
+            row = cur_mat[i]
+            for j in range(row.shape[0]):
+                value = row[j]
+                if np.isnan(value):
+                    continue
+                hist_flat[e0 + i + np.searchsorted(edges, value, side="right")] += 1.0
+                n += 1.0
+                delta = value - mu
+                mu += delta / n
+                acc += delta * (value - mu)
+            count[i] = n
+            mean[i] = mu
+            m2[i] = acc
+
+    psi_kernel = _psi_numba
+    stream_update_kernel = _stream_update_numba
+else:
+    psi_kernel = _psi_numpy
+    stream_update_kernel = _stream_update_numpy
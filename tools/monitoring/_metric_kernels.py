@@ -0,0 +1,83 @@
+"""
+Single-pass classification metric kernels for performance monitoring.
+
+Labels are integer codes in ``[0, n_classes)``. One pass over the labels
+yields per-class true positives, true counts (confusion-matrix row sums) and
+predicted counts (column sums), which is all accuracy and the averaged
+precision/recall/F1 need; the full ``n_classes x n_classes`` matrix is never
+built.
+
+Numba is optional; without it the same counts come from ``np.bincount``,
+over the flattened confusion matrix when there are few enough classes.
+"""
+
+import os
+import sys
+from typing import Tuple
+
+import numpy as np
+
+if sys.platform == "darwin":
+    os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
+try:
+    from numba import get_num_threads, njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+SMALL_N_CLASSES = 256
+LOCAL_COUNTS_BUDGET_BYTES = 16 << 20
+
+
+def _class_counts_numpy(
+    y_true: np.ndarray, y_pred: np.ndarray, n_classes: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if n_classes <= SMALL_N_CLASSES:
+        # One bincount over y_true * K + y_pred gives the whole K x K matrix.
+        cm = np.bincount(
+            y_true.astype(np.int64) * n_classes + y_pred,
+            minlength=n_classes * n_classes,
+        ).reshape(n_classes, n_classes)
+        return (np.diagonal(cm).copy(), cm.sum(axis=1), cm.sum(axis=0))
+    tp = np.bincount(y_true[y_true == y_pred], minlength=n_classes)
+    n_true = np.bincount(y_true, minlength=n_classes)
+    n_pred = np.bincount(y_pred, minlength=n_classes)
+    return (tp, n_true, n_pred)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _class_counts_chunked(
+        y_true: np.ndarray, y_pred: np.ndarray, n_classes: int, n_chunks: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = y_true.shape[0]
+        chunk = (n + n_chunks - 1) // n_chunks
+        local = np.zeros((n_chunks, 3, n_classes), dtype=np.int64)
+        for c in prange(n_chunks):
+            for i in range(c * chunk, min(n, (c + 1) * chunk)):
+                t = y_true[i]
+                p = y_pred[i]
+                local[c, 1, t] += 1
+                local[c, 2, p] += 1
+                if t == p:
+                    local[c, 0, t] += 1
+        counts = np.zeros((3, n_classes), dtype=np.int64)
+        for c in range(n_chunks):
+            counts += local[c]
+        return (counts[0], counts[1], counts[2])
+
+    def _class_counts_numba(
+        y_true: np.ndarray, y_pred: np.ndarray, n_classes: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Per-thread local counts are summed at the end, so no atomics are needed.
+        # Their total size stays within LOCAL_COUNTS_BUDGET_BYTES, using fewer
+        # chunks than threads when there are many classes.
+        budget = LOCAL_COUNTS_BUDGET_BYTES // (3 * 8 * n_classes)
+        n_chunks = max(1, min(get_num_threads(), y_true.shape[0], budget))
+        return _class_counts_chunked(y_true, y_pred, n_classes, n_chunks)
+
+    class_counts_kernel = _class_counts_numba
+else:
+    class_counts_kernel = _class_counts_numpy
@@ -8,28 +8,93 @@ This module provides functionality to:
 4. Track model performance metrics over time
 """
 
+import copy
+import importlib.util
 import json
 import logging
+import multiprocessing
 import os
 import subprocess
-import sys
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 import numpy as np
 import pandas as pd
+from _drift_kernels import PROB_EPSILON, pack_edges, psi_kernel, stream_update_kernel
+from scipy.special import rel_entr
+from scipy.stats import chi2, kstwo
 
 try:
-    from evidently.metric_preset import DataDriftPreset
-    from evidently.report import Report
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import orjson
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes with orjson."""
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    _loads = orjson.loads
 except ImportError:
-    logging.error("Evidently not installed. Please install with: pip install evidently")
-    sys.exit(1)
+
+    def _json_default(obj: Any) -> Any:
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes with the standard library encoder."""
+        return json.dumps(
+            obj, indent=2 if indent else None, default=_json_default
+        ).encode()
+
+    _loads = json.loads
+
+
+if TYPE_CHECKING:
+    from evidently.report import Report
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
     handlers=[logging.StreamHandler(), logging.FileHandler("drift_detection.log")],
 )
 logger = logging.getLogger("drift_detector")
+DATASET_DRIFT_SHARE = 0.5
+DRIFT_METHODS = ("ks", "psi", "js")
+PSI_BINS = 10
+PSI_THRESHOLD = 0.2
+JS_THRESHOLD = 0.1
+DRIFT_HISTORY_FILE = "drift_history.jsonl"
+DRIFT_HISTORY_LIMIT = 100
+MAX_SCORING_WORKERS = 32
+RETRAINING_ENTRYPOINTS = ("run_training_pipeline",)
+_FEATURES_PATHS = (
+    ("data_drift", "data", "metrics", "features"),
+    ("data_drift", "metrics", 0, "features"),
+    ("data_drift", "metrics", 1, "features"),
+)
+_MISSING = object()
+_EVIDENTLY: Optional[Tuple[type, type]] = None
 try:
     from fluxora.core.alert_handler import AlertHandler
     from fluxora.core.config import get_config
@@ -63,6 +128,310 @@ except ImportError:
     alert_handler = MockAlertHandler()
 
 
+@dataclass
+class _RefStats:
+    """Reference-side statistics reused by every drift check."""
+
+    sorted_num: Dict[str, np.ndarray] = field(default_factory=dict)
+    num_mean: Dict[str, float] = field(default_factory=dict)
+    num_std: Dict[str, float] = field(default_factory=dict)
+    cat_counts: Dict[str, np.ndarray] = field(default_factory=dict)
+    categories: Dict[str, pd.Index] = field(default_factory=dict)
+    psi_edges: Dict[str, np.ndarray] = field(default_factory=dict)
+    ref_probs: Dict[str, np.ndarray] = field(default_factory=dict)
+    psi_cols: List[str] = field(default_factory=list)
+    edges_flat: np.ndarray = field(default_factory=lambda: np.empty(0))
+    edges_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, np.int64))
+    ref_probs_flat: np.ndarray = field(default_factory=lambda: np.empty(0))
+    n_ref: int = 0
+
+
+def _ks_pvalue(sorted_ref: np.ndarray, cur_arr: np.ndarray) -> float:
+    """
+    Asymptotic two-sample KS p-value against an already sorted reference.
+
+    Between two consecutive current points the current ECDF is flat and the
+    reference ECDF is monotone, so the KS distance is attained at a current
+    point or just before one. Only the current sample is sorted.
+    """
+    cur_sorted = np.sort(cur_arr)
+    n, m = sorted_ref.size, cur_sorted.size
+    ref_at = np.searchsorted(sorted_ref, cur_sorted, side="right") / n
+    ref_before = np.searchsorted(sorted_ref, cur_sorted, side="left") / n
+    cur_at = np.searchsorted(cur_sorted, cur_sorted, side="right") / m
+    cur_before = np.searchsorted(cur_sorted, cur_sorted, side="left") / m
+    distance = max(
+        np.max(np.abs(ref_at - cur_at)), np.max(np.abs(ref_before - cur_before))
+    )
+    return float(kstwo.sf(distance, np.round(n * m / (n + m))))
+
+
+def _category_counts(values: pd.Series) -> np.ndarray:
+    """Count a categorical series per category code, in category order."""
+    codes = values.cat.codes.to_numpy()
+    return np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+
+
+def _chi2_pvalue(ref_counts: np.ndarray, cur_counts: np.ndarray) -> float:
+    """
+    Chi-square p-value for two category count arrays aligned by code.
+
+    cur_counts may extend past ref_counts with categories unseen in the
+    reference. Matches scipy's chi2_contingency, including Yates' correction
+    for a 2x2 table.
+    """
+    ref_counts = np.pad(ref_counts, (0, cur_counts.size - ref_counts.size))
+    table = np.vstack([ref_counts, cur_counts]).astype(np.float64)
+    table = table[:, table.sum(axis=0) > 0]
+    dof = table.shape[1] - 1
+    if dof < 1:
+        return 1.0
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / table.sum()
+    diff = np.abs(table - expected)
+    if dof == 1:
+        diff = np.maximum(diff - 0.5, 0.0)
+    return float(chi2.sf(np.sum(diff * diff / expected), dof))
+
+
+def _bin_counts(edges: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Count values into the open-ended bins delimited by the inner edges."""
+    return np.bincount(
+        np.searchsorted(edges, values, side="right"), minlength=edges.size + 1
+    )
+
+
+def _to_probs(counts: np.ndarray) -> np.ndarray:
+    return counts / max(counts.sum(), 1) + PROB_EPSILON
+
+
+def _psi(ref_probs: np.ndarray, cur_probs: np.ndarray) -> float:
+    """Population Stability Index."""
+    return float(np.sum((cur_probs - ref_probs) * np.log(cur_probs / ref_probs)))
+
+
+def _js(ref_probs: np.ndarray, cur_probs: np.ndarray) -> float:
+    """Jensen-Shannon divergence (natural log)."""
+    mid = 0.5 * (ref_probs + cur_probs)
+    return float(
+        0.5 * (rel_entr(ref_probs, mid).sum() + rel_entr(cur_probs, mid).sum())
+    )
+
+
+def _score_or_nan(score: Optional[float]) -> float:
+    return np.nan if score is None else score
+
+
+def _mean_score(scores: np.ndarray) -> float:
+    """Mean of the non-NaN feature scores, 0.0 when there are none."""
+    valid = scores[~np.isnan(scores)]
+    return float(valid.mean()) if valid.size else 0.0
+
+
+def _dataset_drift(scores: np.ndarray, cutoff: float) -> bool:
+    """
+    Whether at least DATASET_DRIFT_SHARE of the non-NaN feature scores drift.
+
+    Scores grow with drift for every method, so a feature drifts when its
+    score is above cutoff.
+    """
+    valid = scores[~np.isnan(scores)]
+    drifted = np.count_nonzero(valid > cutoff)
+    return bool(valid.size and drifted >= DATASET_DRIFT_SHARE * valid.size)
+
+
+def _scores_array(feature_scores: Dict[str, float]) -> np.ndarray:
+    return np.fromiter(
+        feature_scores.values(), dtype=np.float64, count=len(feature_scores)
+    )
+
+
+_DIVERGENCES = {"psi": (_psi, PSI_THRESHOLD), "js": (_js, JS_THRESHOLD)}
+
+
+def _extract(d: Any, paths: Tuple[Tuple, ...], default: Any = None) -> Any:
+    """
+    Return the value at the first of ``paths`` that exists in ``d``.
+
+    Each path is a tuple of dict keys and list indices, which lets the drift
+    report be read across Evidently layouts without building empty fallbacks.
+    """
+    for path in paths:
+        cur = d
+        for key in path:
+            if isinstance(cur, dict):
+                cur = cur.get(key, _MISSING)
+            elif isinstance(cur, list) and isinstance(key, int) and key < len(cur):
+                cur = cur[key]
+            else:
+                cur = _MISSING
+            if cur is _MISSING:
+                break
+        else:
+            return cur
+    return default
+
+
+def _load_evidently() -> Tuple[type, type]:
+    """
+    Import Evidently on first use and return (Report, DataDriftPreset).
+
+    Only the detailed-report path needs Evidently, so the fast drift checks
+    do not pay for importing it.
+    """
+    global _EVIDENTLY
+    if _EVIDENTLY is None:
+        try:
+            from evidently.metric_preset import DataDriftPreset
+            from evidently.report import Report
+        except ImportError:
+            logger.error(
+                "Evidently not installed. Please install with: pip install evidently"
+            )
+            raise
+        _EVIDENTLY = (Report, DataDriftPreset)
+    return _EVIDENTLY
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a ``.lock`` sibling of ``path``.
+
+    The lock lives on a separate file because the data file itself is swapped
+    out by os.replace. Locking is skipped where fcntl is unavailable.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path + ".lock", "a+") as lockf:
+        fcntl.flock(lockf, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lockf, fcntl.LOCK_UN)
+
+
+def _atomic_write(path: str, content: bytes) -> None:
+    """Write content to a temporary sibling and atomically move it onto path."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+
+def _load_retraining_entrypoint(script_path: str) -> Optional[Callable]:
+    """
+    Import the retraining script in-process and return its entrypoint.
+
+    Only entrypoints callable without arguments are looked up; a CLI-style
+    main() would parse the monitor's own argv, so scripts that only have one
+    are run as a subprocess with --trigger=drift instead.
+    """
+    spec = importlib.util.spec_from_file_location("fluxora_retraining", script_path)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    for name in RETRAINING_ENTRYPOINTS:
+        entrypoint = getattr(module, name, None)
+        if callable(entrypoint):
+            return entrypoint
+    return None
+
+
+def _run_retraining_entrypoint(script_path: str) -> None:
+    """Process target: load and run the retraining entrypoint."""
+    entrypoint = _load_retraining_entrypoint(script_path)
+    if entrypoint is None:
+        raise RuntimeError(f"No retraining entrypoint in {script_path}")
+    entrypoint()
+
+
+class StreamingDriftState:
+    """
+    Incremental PSI drift state for append-only numerical data.
+
+    Each update() folds a batch into per-feature Welford moments and counts
+    over the reference decile bins, so check() costs the same however much
+    data has been seen. With a window of W, existing counts are decayed by
+    (1 - 1/W) before each batch is added, approximating a sliding window of
+    the last W batches. Categorical features are not tracked.
+    """
+
+    def __init__(self, ref_stats: _RefStats, window: Optional[int] = None) -> Any:
+        """
+        Initialize the streaming state from fitted reference statistics.
+
+        Args:
+            ref_stats: Reference statistics from DriftDetector._fit_reference
+            window: Number of recent batches to weight (None keeps all data)
+        """
+        if window is not None and window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.columns = list(ref_stats.psi_cols)
+        self.window = window
+        self._ref_stats = ref_stats
+        n_features = len(self.columns)
+        self.count = np.zeros(n_features)
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+        self.hist_counts = np.zeros_like(ref_stats.ref_probs_flat)
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """Fold a batch of rows into the running moments and bin counts."""
+        if not self.columns:
+            return
+        if self.window is not None:
+            decay = 1.0 - 1.0 / self.window
+            self.hist_counts *= decay
+            self.count *= decay
+            self.m2 *= decay
+        cur_mat = np.ascontiguousarray(batch[self.columns].to_numpy(dtype=np.float64).T)
+        stream_update_kernel(
+            cur_mat,
+            self._ref_stats.edges_flat,
+            self._ref_stats.edges_offsets,
+            self.count,
+            self.mean,
+            self.m2,
+            self.hist_counts,
+        )
+
+    def moments(self) -> Dict[str, Dict[str, float]]:
+        """Running count, mean and standard deviation per feature."""
+        std = np.sqrt(self.m2 / np.maximum(self.count, 1.0))
+        return {
+            col: {
+                "count": float(self.count[i]),
+                "mean": float(self.mean[i]),
+                "std": float(std[i]),
+            }
+            for i, col in enumerate(self.columns)
+        }
+
+    def check(self) -> Tuple[bool, Dict[str, float]]:
+        """
+        Score the accumulated data against the reference with PSI.
+
+        Returns:
+            Tuple of (dataset_drift_detected, feature_scores)
+        """
+        offsets = self._ref_stats.edges_offsets
+        feature_scores = {}
+        for i, col in enumerate(self.columns):
+            if self.count[i] <= 0:
+                continue
+            b0, b1 = offsets[i] + i, offsets[i + 1] + i + 1
+            feature_scores[col] = _psi(
+                self._ref_stats.ref_probs_flat[b0:b1],
+                _to_probs(self.hist_counts[b0:b1]),
+            )
+        dataset_drift_detected = _dataset_drift(
+            _scores_array(feature_scores), PSI_THRESHOLD
+        )
+        return (dataset_drift_detected, feature_scores)
+
+
 class DriftDetector:
     """Class for detecting data drift and triggering model retraining."""
 
@@ -75,6 +444,8 @@ class DriftDetector:
         retraining_cooldown_hours: int = None,
         model_registry_path: str = None,
         retraining_script_path: str = None,
+        cheap_drift_only: bool = False,
+        retraining_isolation: bool = False,
     ) -> Any:
         """
         Initialize the drift detector.
@@ -87,13 +458,31 @@ class DriftDetector:
             retraining_cooldown_hours: Minimum hours between retraining triggers
             model_registry_path: Path to model registry for tracking versions
             retraining_script_path: Path to script that performs model retraining
+            cheap_drift_only: During the retraining cooldown, run only the PSI
+                drift check since its result cannot trigger retraining
+            retraining_isolation: Run the retraining entrypoint in a forkserver
+                child process instead of the monitor's own process
         """
+        self.column_mapping = column_mapping or config.column_mapping
         if reference_data is None and reference_data_path:
             try:
                 if reference_data_path.endswith(".csv"):
-                    self.reference_data = pd.read_csv(reference_data_path)
+                    self.reference_data = pd.read_csv(
+                        reference_data_path,
+                        usecols=self._needed_columns(),
+                        dtype=self._column_dtypes(),
+                    )
                 elif reference_data_path.endswith(".parquet"):
-                    self.reference_data = pd.read_parquet(reference_data_path)
+                    import pyarrow.parquet as pq
+
+                    table = pq.read_table(
+                        reference_data_path,
+                        columns=self._needed_columns(),
+                        use_threads=True,
+                    )
+                    self.reference_data = table.to_pandas(self_destruct=True).astype(
+                        self._column_dtypes()
+                    )
                 else:
                     raise ValueError(f"Unsupported file format: {reference_data_path}")
             except Exception as e:
@@ -101,155 +490,493 @@ class DriftDetector:
                 self.reference_data = None
         else:
             self.reference_data = reference_data
-        self.column_mapping = column_mapping or config.column_mapping
         self.drift_threshold = drift_threshold or getattr(
             config, "drift_threshold", 0.05
         )
         self.retraining_cooldown_hours = retraining_cooldown_hours or getattr(
             config, "retraining_cooldown_hours", 24
         )
+        self._cooldown_seconds = self.retraining_cooldown_hours * 3600
         self.model_registry_path = model_registry_path or getattr(
             config, "model_registry_path", "models/registry"
         )
         self.retraining_script_path = retraining_script_path or getattr(
             config, "retraining_script_path", "src/models/train.py"
         )
+        self.cheap_drift_only = cheap_drift_only
+        self.retraining_isolation = retraining_isolation
         self.last_retraining_time = self._load_last_retraining_time()
+        self._last_retrain_monotonic = self._to_monotonic(self.last_retraining_time)
         self.drift_history = self._load_drift_history()
+        self._drift_appends = 0
+        self._report_cache: Dict[Tuple, "Report"] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
         logger.info(f"DriftDetector initialized with threshold {self.drift_threshold}")
 
+    def _needed_columns(self) -> List[str]:
+        """Columns of the reference data that drift detection actually reads."""
+        columns = list(self.column_mapping.get("numerical_features", []))
+        columns += self.column_mapping.get("categorical_features", [])
+        return list(dict.fromkeys(columns))
+
+    def _column_dtypes(self) -> Dict[str, str]:
+        """Compact dtypes for reference columns: float32 and category."""
+        dtypes = dict.fromkeys(
+            self.column_mapping.get("numerical_features", []), "float32"
+        )
+        dtypes.update(
+            dict.fromkeys(
+                self.column_mapping.get("categorical_features", []), "category"
+            )
+        )
+        return dtypes
+
+    @property
+    def reference_data(self) -> Optional[pd.DataFrame]:
+        """Reference data; assigning it drops the cached reference statistics."""
+        return self._reference_data
+
+    @reference_data.setter
+    def reference_data(self, value: Optional[pd.DataFrame]) -> None:
+        self._reference_data = value
+        self._ref_stats = None
+
+    def _reference_stats(self) -> Optional[_RefStats]:
+        """
+        Fit the reference statistics for self.column_mapping on first use.
+
+        Fitting is deferred so a detector can be built around reference data
+        that is only ever checked with a column_mapping_override.
+        """
+        if self._ref_stats is None and self._reference_data is not None:
+            reference_data = self._coerce_dtypes(
+                self._reference_data, self.column_mapping
+            )
+            self._ref_stats = self._fit_reference(reference_data, self.column_mapping)
+            self._reference_data = reference_data
+        return self._ref_stats
+
+    @staticmethod
+    def _coerce_dtypes(
+        df: pd.DataFrame,
+        column_mapping: Dict,
+        categories: Optional[Dict[str, pd.Index]] = None,
+    ) -> pd.DataFrame:
+        """
+        Downcast numerical features to float32 and categorical features to
+        category dtype.
+
+        When reference categories are given, categorical columns keep the
+        reference categories first (so their codes match the reference) and
+        append any categories only seen in df. The input frame is not modified.
+        """
+        df = df.copy(deep=False)
+        for col in column_mapping.get("numerical_features", []):
+            df[col] = pd.to_numeric(df[col], downcast="float").astype(np.float32)
+        for col in column_mapping.get("categorical_features", []):
+            ref_categories = (categories or {}).get(col)
+            if ref_categories is None:
+                df[col] = df[col].astype("category")
+                continue
+            observed = pd.Index(df[col].dropna().unique().tolist())
+            df[col] = pd.Categorical(
+                df[col],
+                categories=ref_categories.append(observed.difference(ref_categories)),
+            )
+        return df
+
+    @staticmethod
+    def _fit_reference(reference_data: pd.DataFrame, column_mapping: Dict) -> _RefStats:
+        """Precompute the reference-side statistics used by the fast drift path."""
+        stats = _RefStats(n_ref=len(reference_data))
+        quantiles = np.linspace(0, 1, PSI_BINS + 1)[1:-1]
+        for col in column_mapping.get("numerical_features", []):
+            values = reference_data[col].dropna().to_numpy()
+            stats.sorted_num[col] = np.sort(values)
+            if values.size == 0:
+                continue
+            stats.num_mean[col] = float(values.mean())
+            stats.num_std[col] = float(values.std())
+            edges = np.unique(np.quantile(values, quantiles))
+            stats.psi_edges[col] = edges
+            stats.ref_probs[col] = _to_probs(_bin_counts(edges, values))
+            stats.psi_cols.append(col)
+        stats.edges_flat, stats.edges_offsets, stats.ref_probs_flat = pack_edges(
+            [stats.psi_edges[c] for c in stats.psi_cols],
+            [stats.ref_probs[c] for c in stats.psi_cols],
+        )
+        for col in column_mapping.get("categorical_features", []):
+            counts = _category_counts(reference_data[col])
+            stats.categories[col] = reference_data[col].cat.categories
+            stats.cat_counts[col] = counts
+            stats.ref_probs[col] = _to_probs(np.append(counts, 0))
+        return stats
+
+    @staticmethod
+    def _to_monotonic(timestamp: Optional[datetime]) -> Optional[float]:
+        """
+        Map a wall-clock timestamp onto the monotonic clock.
+
+        The offset from now is measured once, so later wall-clock steps (e.g.
+        NTP corrections) do not shift the cooldown window.
+        """
+        if timestamp is None:
+            return None
+        return time.monotonic() - (datetime.now() - timestamp).total_seconds()
+
     def _load_last_retraining_time(self) -> Optional[datetime]:
         """Load the timestamp of the last model retraining."""
         try:
             registry_file = os.path.join(
                 self.model_registry_path, "retraining_history.json"
             )
-            if os.path.exists(registry_file):
-                with open(registry_file, "r") as f:
-                    history = json.load(f)
-                    if history and "last_retraining_time" in history:
-                        return datetime.fromisoformat(history["last_retraining_time"])
+            with open(registry_file, "rb") as f:
+                history = _loads(f.read())
+            if history and "last_retraining_time" in history:
+                return datetime.fromisoformat(history["last_retraining_time"])
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Error loading retraining history: {e}")
         return None
 
     def _save_last_retraining_time(self, timestamp: datetime) -> None:
         """Save the timestamp of the last model retraining."""
+        if timestamp == self.last_retraining_time:
+            return
         try:
             os.makedirs(self.model_registry_path, exist_ok=True)
             registry_file = os.path.join(
                 self.model_registry_path, "retraining_history.json"
             )
-            history = {}
-            if os.path.exists(registry_file):
-                with open(registry_file, "r") as f:
-                    history = json.load(f)
-            history["last_retraining_time"] = timestamp.isoformat()
-            history.setdefault("retraining_history", []).append(
-                {"timestamp": timestamp.isoformat(), "trigger": "data_drift"}
-            )
-            with open(registry_file, "w") as f:
-                json.dump(history, f, indent=2)
+            with _file_lock(registry_file):
+                try:
+                    with open(registry_file, "rb") as f:
+                        history = _loads(f.read())
+                except FileNotFoundError:
+                    history = {}
+                history["last_retraining_time"] = timestamp.isoformat()
+                history.setdefault("retraining_history", []).append(
+                    {"timestamp": timestamp.isoformat(), "trigger": "data_drift"}
+                )
+                _atomic_write(registry_file, _dumps(history, indent=True))
+            self.last_retraining_time = timestamp
+            self._last_retrain_monotonic = self._to_monotonic(timestamp)
         except Exception as e:
             logger.error(f"Error saving retraining history: {e}")
 
-    def _load_drift_history(self) -> List[Dict]:
-        """Load the history of drift detection results."""
+    def _load_drift_history(self) -> Deque[Dict]:
+        """Load the most recent drift detection results from the append-only log."""
+        history: Deque[Dict] = deque(maxlen=DRIFT_HISTORY_LIMIT)
         try:
-            history_file = os.path.join(self.model_registry_path, "drift_history.json")
-            if os.path.exists(history_file):
-                with open(history_file, "r") as f:
-                    return json.load(f)
+            history_file = os.path.join(self.model_registry_path, DRIFT_HISTORY_FILE)
+            with open(history_file, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        history.append(_loads(line))
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Error loading drift history: {e}")
-        return []
+        return history
 
     def _save_drift_history(
         self, drift_detected: bool, drift_score: float, details: Dict = None
     ) -> None:
-        """Save drift detection results to history."""
+        """
+        Append a drift detection result to the history log.
+
+        Each result is one JSON line; every DRIFT_HISTORY_LIMIT appends the log
+        is compacted down to its last DRIFT_HISTORY_LIMIT lines.
+        """
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "drift_detected": drift_detected,
+            "drift_score": drift_score,
+            "details": details or {},
+        }
+        self.drift_history.append(entry)
         try:
             os.makedirs(self.model_registry_path, exist_ok=True)
-            history_file = os.path.join(self.model_registry_path, "drift_history.json")
-            history = self.drift_history
-            history.append(
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "drift_detected": drift_detected,
-                    "drift_score": drift_score,
-                    "details": details or {},
-                }
-            )
-            if len(history) > 100:
-                history = history[-100:]
-            with open(history_file, "w") as f:
-                json.dump(history, f, indent=2)
-            self.drift_history = history
+            history_file = os.path.join(self.model_registry_path, DRIFT_HISTORY_FILE)
+            self._drift_appends += 1
+            with _file_lock(history_file):
+                if self._drift_appends >= DRIFT_HISTORY_LIMIT:
+                    self._compact_drift_history(history_file, entry)
+                    self._drift_appends = 0
+                else:
+                    with open(history_file, "ab") as f:
+                        f.write(_dumps(entry) + b"\n")
         except Exception as e:
             logger.error(f"Error saving drift history: {e}")
 
+    @staticmethod
+    def _compact_drift_history(history_file: str, entry: Dict) -> None:
+        """
+        Rewrite the history log as its last lines followed by entry.
+
+        The tail is re-read from disk under the caller's lock rather than taken
+        from this process's memory, so lines appended by other monitor
+        processes survive compaction.
+        """
+        lines: Deque[bytes] = deque(maxlen=DRIFT_HISTORY_LIMIT)
+        try:
+            with open(history_file, "rb") as f:
+                lines.extend(line.rstrip(b"\n") for line in f if line.strip())
+        except FileNotFoundError:
+            pass
+        lines.append(_dumps(entry))
+        _atomic_write(history_file, b"\n".join(lines) + b"\n")
+
+    def _fast_drift(
+        self,
+        ref_stats: _RefStats,
+        current_data: pd.DataFrame,
+        column_mapping: Dict,
+        method: str = "ks",
+        threaded: bool = False,
+    ) -> Tuple[bool, Dict[str, float]]:
+        """
+        Compute per-feature drift scores directly with NumPy/SciPy.
+
+        Scores grow with drift for every method. With method "ks" a score is
+        1 - p for a KS test (numerical) or a chi-square test (categorical
+        features), and a feature drifts when its p-value is below
+        drift_threshold. With "psi" or "js" scores are divergences over
+        reference deciles (or category frequencies plus an unseen bucket) and
+        a feature drifts above PSI_THRESHOLD / JS_THRESHOLD.
+
+        With threaded set, features are scored on a shared thread pool; the
+        NumPy sorts, searches and bincounts behind each score release the GIL.
+
+        Returns:
+            Tuple of (dataset_drift_detected, feature_scores)
+        """
+        feature_scores = {}
+        divergence, cutoff = _DIVERGENCES.get(
+            method, (None, 1.0 - self.drift_threshold)
+        )
+        numerical = list(column_mapping.get("numerical_features", []))
+        cur_mat = self._feature_matrix(current_data, numerical)
+        rows = {col: i for i, col in enumerate(numerical)}
+        if method == "psi" and ref_stats.psi_cols:
+            psi_rows = [rows[c] for c in ref_stats.psi_cols]
+            psi_mat = cur_mat if psi_rows == list(rows.values()) else cur_mat[psi_rows]
+            feature_scores.update(self._psi_numerical(ref_stats, psi_mat))
+            numerical = [c for c in numerical if c not in ref_stats.psi_cols]
+        categorical = column_mapping.get("categorical_features", [])
+
+        def score(col: str) -> Optional[float]:
+            if col in ref_stats.cat_counts:
+                return self._score_categorical(
+                    ref_stats, col, current_data[col], divergence
+                )
+            return self._score_numerical(ref_stats, col, cur_mat[rows[col]], divergence)
+
+        columns = list(numerical) + list(categorical)
+        if threaded and len(columns) > 1:
+            scores = self._scoring_pool().map(score, columns)
+        else:
+            scores = map(score, columns)
+        for col, value in zip(columns, scores):
+            if value is not None:
+                feature_scores[col] = value
+        dataset_drift_detected = _dataset_drift(_scores_array(feature_scores), cutoff)
+        return (dataset_drift_detected, feature_scores)
+
+    @staticmethod
+    def _score_numerical(
+        ref_stats: _RefStats,
+        col: str,
+        values: np.ndarray,
+        divergence: Optional[Callable],
+    ) -> Optional[float]:
+        """Score one numerical feature, or None when either side is empty."""
+        sorted_ref = ref_stats.sorted_num[col]
+        cur_arr = values[~np.isnan(values)]
+        if sorted_ref.size == 0 or cur_arr.size == 0:
+            return None
+        if divergence is None:
+            return 1.0 - _ks_pvalue(sorted_ref, cur_arr)
+        counts = _bin_counts(ref_stats.psi_edges[col], cur_arr)
+        return divergence(ref_stats.ref_probs[col], _to_probs(counts))
+
+    @staticmethod
+    def _score_categorical(
+        ref_stats: _RefStats,
+        col: str,
+        values: pd.Series,
+        divergence: Optional[Callable],
+    ) -> Optional[float]:
+        """Score one categorical feature, or None when either side is empty."""
+        ref_counts = ref_stats.cat_counts[col]
+        cur_counts = _category_counts(values)
+        if not ref_counts.any() or not cur_counts.any():
+            return None
+        if divergence is None:
+            return 1.0 - _chi2_pvalue(ref_counts, cur_counts)
+        k = ref_counts.size
+        counts = np.append(cur_counts[:k], cur_counts[k:].sum())
+        return divergence(ref_stats.ref_probs[col], _to_probs(counts))
+
+    def _scoring_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for per-feature scoring, created on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=min(MAX_SCORING_WORKERS, os.cpu_count() or 1),
+                thread_name_prefix="drift-score",
+            )
+        return self._pool
+
+    @staticmethod
+    def _feature_matrix(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """
+        Materialize numerical columns once as a feature-major float32 matrix.
+
+        Row i holds feature columns[i] as one contiguous slice, so the
+        per-feature scorers and kernels scan memory sequentially instead of
+        going back to the DataFrame for each column.
+        """
+        if not columns:
+            return np.empty((0, len(df)), dtype=np.float32)
+        return np.ascontiguousarray(df[columns].to_numpy(dtype=np.float32).T)
+
+    @staticmethod
+    def _psi_numerical(ref_stats: _RefStats, cur_mat: np.ndarray) -> Dict[str, float]:
+        """
+        Score every binned numerical feature with the column-parallel PSI kernel.
+
+        cur_mat is feature-major with one row per column of ref_stats.psi_cols.
+        """
+        scores = psi_kernel(
+            cur_mat,
+            ref_stats.edges_flat,
+            ref_stats.edges_offsets,
+            ref_stats.ref_probs_flat,
+        )
+        has_values = ~np.isnan(cur_mat).all(axis=1)
+        return {
+            col: score
+            for col, score, valid in zip(
+                ref_stats.psi_cols, scores.tolist(), has_values
+            )
+            if valid
+        }
+
+    def _evidently_drift(
+        self,
+        reference_data: pd.DataFrame,
+        current_data: pd.DataFrame,
+        column_mapping: Dict,
+    ) -> Tuple["Report", bool, Dict[str, float]]:
+        """
+        Run the Evidently DataDriftPreset and pull per-feature scores out of it.
+
+        The preset is pinned to the KS and chi-square tests of the fast path,
+        and its p-values are turned into the same 1 - p scores, so both paths
+        agree on which features and datasets drift.
+
+        An unrun Report is cached per feature-name lists; Reports keep their
+        results after run(), so each call works on a copy of the template.
+
+        Returns:
+            Tuple of (drift_report, dataset_drift_detected, feature_scores)
+        """
+        key = (
+            tuple(column_mapping.get("numerical_features", [])),
+            tuple(column_mapping.get("categorical_features", [])),
+        )
+        template = self._report_cache.get(key)
+        if template is None:
+            Report, DataDriftPreset = _load_evidently()
+            template = Report(
+                metrics=[
+                    DataDriftPreset(
+                        num_feature_names=list(key[0]),
+                        cat_feature_names=list(key[1]),
+                        num_stattest="ks",
+                        cat_stattest="chisquare",
+                        stattest_threshold=self.drift_threshold,
+                    )
+                ]
+            )
+            self._report_cache[key] = template
+        data_drift_report = copy.deepcopy(template)
+        data_drift_report.run(reference_data=reference_data, current_data=current_data)
+        features = _extract(data_drift_report.as_dict(), _FEATURES_PATHS, None) or {}
+        scores = 1.0 - np.fromiter(
+            (_score_or_nan(fd.get("drift_score")) for fd in features.values()),
+            dtype=np.float64,
+            count=len(features),
+        )
+        feature_scores = dict(zip(features.keys(), scores.tolist()))
+        dataset_drift_detected = _dataset_drift(scores, 1.0 - self.drift_threshold)
+        return (data_drift_report, dataset_drift_detected, feature_scores)
+
     def detect_drift(
         self,
         current_data: pd.DataFrame,
         reference_data: pd.DataFrame = None,
         column_mapping_override: Dict = None,
-    ) -> Tuple[Optional[Report], bool, float]:
+        detailed_report: bool = False,
+        method: str = "ks",
+        threaded: bool = False,
+    ) -> Tuple[Optional["Report"], bool, float]:
         """
         Detect data drift between current data and reference data.
 
+        By default per-feature scores are 1 - p for a two-sample KS test
+        (numerical) or a chi-square test (categorical); method="psi" or "js"
+        scores features by PSI or Jensen-Shannon divergence instead. The full
+        Evidently report is only built when detailed_report is True and is
+        scored with the same tests.
+
+        The returned drift_score, also stored in the drift history, is the
+        mean feature score. It grows with drift for every method.
+
         Args:
             current_data: DataFrame containing current data to check for drift
             reference_data: DataFrame containing reference data (optional, uses self.reference_data if None)
             column_mapping_override: Optional override for column mapping
+            detailed_report: Build and return the Evidently report (slow path)
+            method: Fast-path statistic, one of DRIFT_METHODS
+            threaded: Score features of the fast path on a thread pool
 
         Returns:
             Tuple of (drift_report, drift_detected, drift_score)
         """
+        if method not in DRIFT_METHODS:
+            raise ValueError(f"Unsupported drift method: {method}")
+        column_mapping = column_mapping_override or self.column_mapping
+        use_cached_stats = False
         if reference_data is None:
             reference_data = self.reference_data
+            use_cached_stats = column_mapping_override is None
         if reference_data is None:
             logger.error("No reference data provided for drift detection")
             return (None, False, 0.0)
-        column_mapping = column_mapping_override or self.column_mapping
         try:
-            data_drift_report = Report(
-                metrics=[
-                    DataDriftPreset(
-                        num_feature_names=column_mapping.get("numerical_features", []),
-                        cat_feature_names=column_mapping.get(
-                            "categorical_features", []
-                        ),
+            if detailed_report:
+                (
+                    data_drift_report,
+                    dataset_drift_detected,
+                    feature_scores,
+                ) = self._evidently_drift(reference_data, current_data, column_mapping)
+            else:
+                data_drift_report = None
+                ref_stats = self._reference_stats() if use_cached_stats else None
+                if ref_stats is None:
+                    ref_stats = self._fit_reference(
+                        self._coerce_dtypes(reference_data, column_mapping),
+                        column_mapping,
                     )
-                ]
-            )
-            data_drift_report.run(
-                reference_data=reference_data, current_data=current_data
-            )
-            drift_info = data_drift_report.as_dict().get("data_drift", {})
-            dataset_drift_detected = (
-                drift_info.get("data", {})
-                .get("metrics", {})
-                .get("dataset_drift", False)
-            )
-            if not isinstance(dataset_drift_detected, bool):
-                dataset_drift_detected = drift_info.get("metrics", [{}])[0].get(
-                    "dataset_drift", False
+                current_data = self._coerce_dtypes(
+                    current_data, column_mapping, ref_stats.categories
+                )
+                dataset_drift_detected, feature_scores = self._fast_drift(
+                    ref_stats, current_data, column_mapping, method, threaded
                 )
-            drift_scores = []
-            features = drift_info.get("data", {}).get("metrics", {}).get("features", {})
-            if not features:
-                features = {}
-                for metric in drift_info.get("metrics", []):
-                    if "features" in metric:
-                        features = metric["features"]
-                        break
-            for feature_name, feature_data in features.items():
-                drift_score = feature_data.get("drift_score", None)
-                if drift_score is not None:
-                    drift_scores.append(drift_score)
-            avg_drift_score = np.mean(drift_scores) if drift_scores else 0.0
-            if avg_drift_score > self.drift_threshold:
-                dataset_drift_detected = True
+            avg_drift_score = _mean_score(_scores_array(feature_scores))
             if dataset_drift_detected:
                 logger.warning(
                     f"DATA DRIFT DETECTED! Average drift score: {avg_drift_score:.4f}"
@@ -270,11 +997,7 @@ class DriftDetector:
             self._save_drift_history(
                 drift_detected=dataset_drift_detected,
                 drift_score=avg_drift_score,
-                details={
-                    "feature_scores": {
-                        k: v.get("drift_score", 0) for k, v in features.items()
-                    }
-                },
+                details={"feature_scores": feature_scores},
             )
             return (data_drift_report, dataset_drift_detected, avg_drift_score)
         except Exception as e:
@@ -286,6 +1009,21 @@ class DriftDetector:
             )
             return (None, False, 0.0)
 
+    def streaming_state(self, window: Optional[int] = None) -> StreamingDriftState:
+        """
+        Create incremental drift state against the current reference data.
+
+        Args:
+            window: Number of recent batches to weight (None keeps all data)
+
+        Returns:
+            StreamingDriftState for the reference's numerical features
+        """
+        ref_stats = self._reference_stats()
+        if ref_stats is None:
+            raise ValueError("No reference data available for streaming drift")
+        return StreamingDriftState(ref_stats, window=window)
+
     def should_trigger_retraining(self) -> bool:
         """
         Check if retraining should be triggered based on cooldown period.
@@ -293,11 +1031,52 @@ class DriftDetector:
         Returns:
             bool: True if retraining should be triggered, False otherwise
         """
-        if self.last_retraining_time is None:
+        if self._last_retrain_monotonic is None:
             return True
-        cooldown_delta = timedelta(hours=self.retraining_cooldown_hours)
-        time_since_last_retraining = datetime.now() - self.last_retraining_time
-        return time_since_last_retraining > cooldown_delta
+        elapsed = time.monotonic() - self._last_retrain_monotonic
+        return elapsed > self._cooldown_seconds
+
+    def _run_retraining(self) -> Optional[str]:
+        """
+        Run the retraining script's entrypoint.
+
+        The script is imported and its entrypoint called in-process (or in a
+        forkserver child when retraining_isolation is set), which reuses the
+        already imported ML libraries. If the script cannot be imported it is
+        run as a subprocess as before.
+
+        Returns:
+            None on success, otherwise an error message
+        """
+        if self.retraining_isolation:
+            process = multiprocessing.get_context("forkserver").Process(
+                target=_run_retraining_entrypoint, args=(self.retraining_script_path,)
+            )
+            process.start()
+            process.join()
+            if process.exitcode == 0:
+                return None
+            return f"Retraining process exited with code {process.exitcode}"
+        try:
+            entrypoint = _load_retraining_entrypoint(self.retraining_script_path)
+        except (Exception, SystemExit) as e:
+            logger.warning(f"Could not import retraining script, using subprocess: {e}")
+            entrypoint = None
+        if entrypoint is None:
+            result = subprocess.run(
+                ["python", self.retraining_script_path, "--trigger=drift"],
+                capture_output=True,
+                text=True,
+            )
+            return None if result.returncode == 0 else result.stderr
+        try:
+            entrypoint()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                return f"Retraining entrypoint exited with code {e.code}"
+        except Exception as e:
+            return str(e)
+        return None
 
     def trigger_retraining(self) -> bool:
         """
@@ -318,12 +1097,8 @@ class DriftDetector:
                     f"Retraining script not found at {self.retraining_script_path}"
                 )
                 return False
-            result = subprocess.run(
-                ["python", self.retraining_script_path, "--trigger=drift"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
+            error = self._run_retraining()
+            if error is None:
                 logger.info("Model retraining triggered successfully")
                 self._save_last_retraining_time(datetime.now())
                 alert_handler.trigger_alert(
@@ -333,10 +1108,10 @@ class DriftDetector:
                 )
                 return True
             else:
-                logger.error(f"Model retraining failed: {result.stderr}")
+                logger.error(f"Model retraining failed: {error}")
                 alert_handler.trigger_alert(
                     "MODEL_RETRAINING_FAILED",
-                    details={"trigger": "data_drift", "error": result.stderr},
+                    details={"trigger": "data_drift", "error": error},
                     level="ERROR",
                 )
                 return False
@@ -366,6 +1141,14 @@ class DriftDetector:
             "retraining_triggered": False,
             "retraining_successful": False,
         }
+        if self.cheap_drift_only and not self.should_trigger_retraining():
+            _, drift_detected, drift_score = self.detect_drift(
+                current_data, method="psi"
+            )
+            results["drift_detected"] = drift_detected
+            results["drift_score"] = drift_score
+            logger.info("Retraining cooldown active; ran PSI-only drift check")
+            return results
         drift_report, drift_detected, drift_score = self.detect_drift(current_data)
         results["drift_detected"] = drift_detected
         results["drift_score"] = drift_score
@@ -384,7 +1167,7 @@ def detect_data_drift(
     current_data: pd.DataFrame,
     reference_data: pd.DataFrame = None,
     column_mapping_override: Dict = None,
-) -> Tuple[Optional[Report], bool]:
+) -> Tuple[Optional["Report"], bool]:
     """
     Legacy function for detecting data drift between current data and reference data.
 
@@ -398,7 +1181,9 @@ def detect_data_drift(
     """
     detector = DriftDetector(reference_data=reference_data)
     report, drift_detected, _ = detector.detect_drift(
-        current_data=current_data, column_mapping_override=column_mapping_override
+        current_data=current_data,
+        column_mapping_override=column_mapping_override,
+        detailed_report=True,
     )
     return (report, drift_detected)
 
@@ -1,4 +1,13 @@
+import atexit
+import threading
 import time
+import weakref
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Any, Callable, DefaultDict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from _metric_kernels import class_counts_kernel
 from fluxora.core.alert_handler import AlertHandler
 from fluxora.core.logger import get_logger
 from prometheus_client import Counter, Gauge, Histogram
@@ -14,23 +23,38 @@ from sklearn.metrics import (
 
 logger = get_logger(__name__)
 alert_handler = AlertHandler()
-MODEL_MAE = Gauge("model_mean_absolute_error", "Model Mean Absolute Error over time")
-MODEL_MSE = Gauge("model_mean_squared_error", "Model Mean Squared Error over time")
+MODEL_LABELS = ["model_name", "model_version"]
+MODEL_MAE = Gauge(
+    "model_mean_absolute_error", "Model Mean Absolute Error over time", MODEL_LABELS
+)
+MODEL_MSE = Gauge(
+    "model_mean_squared_error", "Model Mean Squared Error over time", MODEL_LABELS
+)
 MODEL_RMSE = Gauge(
-    "model_root_mean_squared_error", "Model Root Mean Squared Error over time"
+    "model_root_mean_squared_error",
+    "Model Root Mean Squared Error over time",
+    MODEL_LABELS,
+)
+MODEL_R2_SCORE = Gauge(
+    "model_r_squared_score", "Model R-squared score over time", MODEL_LABELS
+)
+MODEL_ACCURACY = Gauge(
+    "model_accuracy_score", "Model Accuracy score over time", MODEL_LABELS
 )
-MODEL_R2_SCORE = Gauge("model_r_squared_score", "Model R-squared score over time")
-MODEL_ACCURACY = Gauge("model_accuracy_score", "Model Accuracy score over time")
 MODEL_PRECISION = Gauge(
-    "model_precision_score", "Model Precision score over time (macro average)"
+    "model_precision_score",
+    "Model Precision score over time (macro average)",
+    MODEL_LABELS,
 )
 MODEL_RECALL = Gauge(
-    "model_recall_score", "Model Recall score over time (macro average)"
+    "model_recall_score", "Model Recall score over time (macro average)", MODEL_LABELS
+)
+MODEL_F1_SCORE = Gauge(
+    "model_f1_score", "Model F1 score over time (macro average)", MODEL_LABELS
 )
-MODEL_F1_SCORE = Gauge("model_f1_score", "Model F1 score over time (macro average)")
 API_REQUESTS_TOTAL = Counter(
     "api_requests_total",
-    "Total number of API requests",
+    "Total number of API requests (status_code bucketed as 2xx..5xx)",
     ["endpoint", "method", "status_code"],
 )
 API_REQUEST_LATENCY = Histogram(
@@ -67,15 +91,587 @@ PERFORMANCE_THRESHOLDS = {
     "accuracy_drop_abs": 0.05,
 }
 BASELINE_METRICS = {"mae": None, "r2_score": None, "accuracy": None}
+_DERIVED = {"mae_limit": None, "r2_floor": None, "accuracy_floor": None}
+FAST_AVERAGES = ("macro", "weighted", "micro")
+MAX_DENSE_LABEL_SPAN = 65536
+LABEL_CHILD_CACHE_SIZE = 4096
+_STATUS_BUCKETS = {2: "2xx", 3: "3xx", 4: "4xx", 5: "5xx"}
+SCORE_CACHE_SIZE = 8
+SCORE_CACHE_MAX_ITEMS = 65536
+_scratch = threading.local()
+_SCORE_CACHE: "OrderedDict[Tuple, Tuple[np.ndarray, np.ndarray, Tuple]]" = OrderedDict()
+_SCORE_CACHE_LOCK = threading.Lock()
+REQUEST_BATCH_SIZE = 256
+REQUEST_FLUSH_INTERVAL_SECONDS = 1.0
+
+
+@lru_cache(maxsize=LABEL_CHILD_CACHE_SIZE)
+def _request_child(endpoint: str, method: str, status_code: str) -> Counter:
+    return API_REQUESTS_TOTAL.labels(endpoint, method, status_code)
+
+
+@lru_cache(maxsize=LABEL_CHILD_CACHE_SIZE)
+def _latency_child(endpoint: str, method: str) -> Histogram:
+    return API_REQUEST_LATENCY.labels(endpoint, method)
+
+
+@lru_cache(maxsize=LABEL_CHILD_CACHE_SIZE)
+def _regression_children(
+    model_name: str, model_version: str
+) -> Tuple[Gauge, Gauge, Gauge, Gauge]:
+    return tuple(
+        gauge.labels(model_name, model_version)
+        for gauge in (MODEL_MAE, MODEL_MSE, MODEL_RMSE, MODEL_R2_SCORE)
+    )
+
+
+@lru_cache(maxsize=LABEL_CHILD_CACHE_SIZE)
+def _classification_children(
+    model_name: str, model_version: str
+) -> Tuple[Gauge, Gauge, Gauge, Gauge]:
+    return tuple(
+        gauge.labels(model_name, model_version)
+        for gauge in (MODEL_ACCURACY, MODEL_PRECISION, MODEL_RECALL, MODEL_F1_SCORE)
+    )
+
+
+@lru_cache(maxsize=LABEL_CHILD_CACHE_SIZE)
+def _prediction_child(model_name: str, model_version: str) -> Histogram:
+    return PREDICTION_LATENCY.labels(model_name, model_version)
+
+
+def _update_derived_limit(metric_name: str, value: Optional[float]) -> None:
+    """Precompute the alert limit implied by a baseline and its threshold."""
+    if metric_name == "mae":
+        _DERIVED["mae_limit"] = (
+            None
+            if value is None
+            else value * (1 + PERFORMANCE_THRESHOLDS["mae_increase_pct"] / 100)
+        )
+    elif metric_name == "r2_score":
+        _DERIVED["r2_floor"] = (
+            None
+            if value is None
+            else value * (1 - PERFORMANCE_THRESHOLDS["r2_decrease_pct"] / 100)
+        )
+    elif metric_name == "accuracy":
+        _DERIVED["accuracy_floor"] = (
+            None
+            if value is None
+            else value - PERFORMANCE_THRESHOLDS["accuracy_drop_abs"]
+        )
 
 
 def update_baseline_metric(metric_name: str, value: float) -> Any:
     """Updates a baseline metric value."""
     if metric_name in BASELINE_METRICS:
         BASELINE_METRICS[metric_name] = value
-        logger.info(f"Baseline for {metric_name} updated to: {value}")
+        _update_derived_limit(metric_name, value)
+        with _SCORE_CACHE_LOCK:
+            _SCORE_CACHE.clear()
+        logger.info("Baseline for %s updated to: %s", metric_name, value)
+    else:
+        logger.warning("Attempted to update unknown baseline metric: %s", metric_name)
+
+
+def _resolve_child(getter: Callable, *labels: Any) -> Optional[Any]:
+    """
+    Look up a labelled child, logging label errors instead of raising.
+
+    Label validation is the only realistic failure of a metric update, so it
+    is handled here, on the lookup, rather than around every inc/observe.
+    """
+    try:
+        return getter(*labels)
+    except Exception as e:
+        logger.error("Error resolving metric labels %s: %s", labels, e)
+        return None
+
+
+def _status_bucket(status_code: int) -> str:
+    try:
+        return _STATUS_BUCKETS.get(int(status_code) // 100, "other")
+    except (TypeError, ValueError):
+        return "other"
+
+
+class _RequestBuffer:
+    """Pending API request updates recorded by one thread."""
+
+    def __init__(self) -> Any:
+        self.owner = weakref.ref(threading.current_thread())
+        self.lock = threading.Lock()
+        self.counts: DefaultDict[Tuple[str, str, str], int] = defaultdict(int)
+        self.samples: DefaultDict[Tuple[str, str], List[float]] = defaultdict(list)
+        self.pending = 0
+
+
+class _BatchedMetrics:
+    """
+    Thread-local batching for API request metrics.
+
+    Each thread records into its own buffer and replays it into the
+    Prometheus children every batch_size calls, so worker threads do not
+    contend on the metric locks for every request. A daemon thread flushes
+    every buffer each flush_interval seconds, which bounds how long updates
+    from idle threads stay pending, and buffers of exited threads are
+    dropped once replayed. flush() also runs at interpreter exit.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float) -> Any:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._buffers: List[_RequestBuffer] = []
+        self._buffers_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+
+    def _buffer(self) -> _RequestBuffer:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = _RequestBuffer()
+            self._local.buffer = buffer
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_periodically,
+                        name="request-metrics-flush",
+                        daemon=True,
+                    )
+                    self._flusher.start()
+        return buffer
+
+    def record(
+        self, endpoint: str, method: str, status_code: str, latency_seconds: float
+    ) -> None:
+        latency_seconds = float(latency_seconds)
+        buffer = self._buffer()
+        with buffer.lock:
+            buffer.counts[(endpoint, method, status_code)] += 1
+            buffer.samples[(endpoint, method)].append(latency_seconds)
+            buffer.pending += 1
+            due = buffer.pending >= self.batch_size
+        if due:
+            self._replay(buffer)
+
+    @staticmethod
+    def _replay(buffer: _RequestBuffer) -> None:
+        with buffer.lock:
+            counts, samples = buffer.counts, buffer.samples
+            buffer.counts, buffer.samples = defaultdict(int), defaultdict(list)
+            buffer.pending = 0
+        for key, n in counts.items():
+            try:
+                _request_child(*key).inc(n)
+            except Exception as e:
+                logger.error("Error replaying API request count for %s: %s", key, e)
+        for key, latencies in samples.items():
+            try:
+                child = _latency_child(*key)
+                for latency_seconds in latencies:
+                    child.observe(latency_seconds)
+            except Exception as e:
+                logger.error("Error replaying API request latency for %s: %s", key, e)
+
+    def flush(self) -> None:
+        """Replay the pending updates of every thread."""
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        # Threads found dead here cannot record again, so their buffers are
+        # complete and can be dropped once replayed.
+        dead = [b for b in buffers if b.owner() is None or not b.owner().is_alive()]
+        for buffer in buffers:
+            self._replay(buffer)
+        if dead:
+            with self._buffers_lock:
+                self._buffers = [b for b in self._buffers if b not in dead]
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error("Error flushing API request metrics: %s", e)
+
+
+_request_batches = _BatchedMetrics(REQUEST_BATCH_SIZE, REQUEST_FLUSH_INTERVAL_SECONDS)
+atexit.register(_request_batches.flush)
+
+
+def _scratch_buffer(size: int) -> np.ndarray:
+    """Return this thread's float64 scratch buffer, resized only when needed."""
+    buffer = getattr(_scratch, "diff", None)
+    if buffer is None or buffer.size != size:
+        buffer = np.empty(size, dtype=np.float64)
+        _scratch.diff = buffer
+    return buffer
+
+
+def _regression_scores(y_true: Any, y_pred: Any) -> Tuple[float, float, float, float]:
+    """
+    Compute MAE, MSE, RMSE and R2 from one shared residual vector.
+
+    Inputs are brought into contiguous float64 buffers once (float32 would
+    lose precision in the reductions), and sums of squares are BLAS dot
+    products. The residual lives in a per-thread scratch buffer that is
+    reused while batch sizes stay the same, and is never squared into a
+    temporary. Non-1-D inputs fall back to sklearn.
+
+    Returns:
+        Tuple of (mae, mse, rmse, r2)
+    """
+    yt = np.ascontiguousarray(y_true, dtype=np.float64)
+    yp = np.ascontiguousarray(y_pred, dtype=np.float64)
+    if yt.ndim != 1 or yp.ndim != 1:
+        mse = mean_squared_error(y_true, y_pred)
+        mae = mean_absolute_error(y_true, y_pred)
+        return (mae, mse, mse**0.5, r2_score(y_true, y_pred))
+    if yt.shape != yp.shape or yt.size == 0:
+        raise ValueError(
+            f"y_true and y_pred must be non-empty with equal shapes: "
+            f"{yt.shape} != {yp.shape}"
+        )
+    n = yt.size
+    diff = np.subtract(yp, yt, out=_scratch_buffer(n))
+    sse = float(diff @ diff)
+    mae = float(np.abs(diff, out=diff).sum()) / n
+    mse = sse / n
+    centered = np.subtract(yt, yt.sum() / n, out=diff)
+    ss_tot = float(centered @ centered)
+    if ss_tot == 0.0:
+        r2 = 1.0 if sse == 0.0 else 0.0
     else:
-        logger.warning(f"Attempted to update unknown baseline metric: {metric_name}")
+        r2 = 1.0 - sse / ss_tot
+    return (mae, mse, mse**0.5, r2)
+
+
+def _encode_labels(
+    y_true: Any, y_pred: Any
+) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Map integer labels onto dense int32 codes shared by y_true and y_pred.
+
+    Labels are offset by their minimum while the range they span is at most
+    MAX_DENSE_LABEL_SPAN and the number of labels; sparser labels are
+    compacted to their distinct values so the count arrays stay small.
+
+    Returns None for non-integer or non-1-D labels (e.g. multilabel indicator
+    matrices), which are left to sklearn.
+    """
+    yt = np.asarray(y_true)
+    yp = np.asarray(y_pred)
+    if yt.dtype.kind not in "iub" or yp.dtype.kind not in "iub" or yt.size == 0:
+        return None
+    if yt.ndim != 1 or yp.ndim != 1:
+        return None
+    if yt.shape != yp.shape:
+        raise ValueError(
+            f"y_true and y_pred have different shapes: {yt.shape} != {yp.shape}"
+        )
+    yt = yt.astype(np.int64, copy=False)
+    yp = yp.astype(np.int64, copy=False)
+    lo = min(yt.min(), yp.min())
+    n_classes = int(max(yt.max(), yp.max()) - lo + 1)
+    if n_classes > min(yt.size + yp.size, MAX_DENSE_LABEL_SPAN):
+        labels, codes = np.unique(np.concatenate([yt, yp]), return_inverse=True)
+        codes = codes.astype(np.int32)
+        return (codes[: yt.size], codes[yt.size :], labels.size)
+    return ((yt - lo).astype(np.int32), (yp - lo).astype(np.int32), n_classes)
+
+
+def _scores_from_counts(
+    tp: np.ndarray, n_true: np.ndarray, n_pred: np.ndarray, average: str
+) -> np.ndarray:
+    """
+    Derive accuracy, precision, recall and F1 from per-class counts.
+
+    Counts are (n_models, n_classes) arrays, or 1-D for a single model.
+    Classes absent from both y_true and y_pred are ignored and zero
+    divisions score 0, as with sklearn's zero_division=0.
+
+    Returns:
+        (n_models, 4) array of (accuracy, precision, recall, f1)
+    """
+    tp, n_true, n_pred = (
+        np.atleast_2d(a).astype(np.float64) for a in (tp, n_true, n_pred)
+    )
+    accuracy = tp.sum(axis=1) / n_true.sum(axis=1)
+    if average == "micro":
+        return np.column_stack([accuracy] * 4)
+    support = n_true + n_pred
+    precision = np.divide(tp, n_pred, out=np.zeros_like(tp), where=n_pred > 0)
+    recall = np.divide(tp, n_true, out=np.zeros_like(tp), where=n_true > 0)
+    f1 = np.divide(2 * tp, support, out=np.zeros_like(tp), where=support > 0)
+    weights = n_true if average == "weighted" else (support > 0).astype(np.float64)
+    total = weights.sum(axis=1)
+    averaged = [(m * weights).sum(axis=1) / total for m in (precision, recall, f1)]
+    return np.column_stack([accuracy] + averaged)
+
+
+def _classification_scores(
+    y_true: Any, y_pred: Any, average: str
+) -> Tuple[float, float, float, float]:
+    """
+    Compute accuracy, precision, recall and F1 from a single labelling pass.
+
+    Integer labels with a macro, weighted or micro average go through the
+    class-count kernel; anything else falls back to sklearn.
+
+    Returns:
+        Tuple of (accuracy, precision, recall, f1)
+    """
+    encoded = _encode_labels(y_true, y_pred) if average in FAST_AVERAGES else None
+    if encoded is None:
+        return (
+            accuracy_score(y_true, y_pred),
+            precision_score(y_true, y_pred, average=average, zero_division=0),
+            recall_score(y_true, y_pred, average=average, zero_division=0),
+            f1_score(y_true, y_pred, average=average, zero_division=0),
+        )
+    scores = _scores_from_counts(*class_counts_kernel(*encoded), average)
+    return tuple(scores[0].tolist())
+
+
+def _memo_input(values: Any) -> Optional[np.ndarray]:
+    """
+    The input as an array the score memo can compare, or None to bypass it.
+
+    Object arrays and inputs larger than SCORE_CACHE_MAX_ITEMS bypass the
+    memo, which bounds the copies it holds.
+    """
+    arr = np.asarray(values)
+    if arr.dtype.hasobject or arr.size > SCORE_CACHE_MAX_ITEMS:
+        return None
+    return arr
+
+
+def _memoized_scores(
+    kind: str, y_true: Any, y_pred: Any, compute: Callable[[], Tuple]
+) -> Tuple:
+    """
+    Reuse the scores of the last few calls made with equal inputs.
+
+    Entries are keyed on kind, dtypes and shapes, and keep copies of y_true
+    and y_pred that are compared element-wise on a hit, so buffers refilled
+    in place are rescored. Retries of a logging call are the intended hit.
+
+    Only classification scores go through here: a hit is several times
+    cheaper than the label encoding and class counts it skips, while
+    regression scores cost about as much as the comparison itself.
+    """
+    arr_true = _memo_input(y_true)
+    arr_pred = _memo_input(y_pred)
+    if arr_true is None or arr_pred is None:
+        return compute()
+    key = (kind, arr_true.dtype.str, arr_true.shape, arr_pred.dtype.str, arr_pred.shape)
+    with _SCORE_CACHE_LOCK:
+        cached = _SCORE_CACHE.get(key)
+        if cached is not None:
+            _SCORE_CACHE.move_to_end(key)
+    if (
+        cached is not None
+        and np.array_equal(cached[0], arr_true)
+        and np.array_equal(cached[1], arr_pred)
+    ):
+        return cached[2]
+    scores = compute()
+    entry = (arr_true.copy(), arr_pred.copy(), scores)
+    with _SCORE_CACHE_LOCK:
+        _SCORE_CACHE[key] = entry
+        _SCORE_CACHE.move_to_end(key)
+        if len(_SCORE_CACHE) > SCORE_CACHE_SIZE:
+            _SCORE_CACHE.popitem(last=False)
+    return scores
+
+
+def _stack_pairs(
+    pairs: Sequence[Tuple[Any, Any]], dtype: Any = None
+) -> Optional[Tuple]:
+    """
+    Concatenate 1-D (y_true, y_pred) pairs into flat arrays.
+
+    Returns:
+        Tuple of (y_true, y_pred, lengths), or None if any input is not 1-D
+    """
+    yts = [np.asarray(y_true, dtype=dtype) for y_true, _ in pairs]
+    yps = [np.asarray(y_pred, dtype=dtype) for _, y_pred in pairs]
+    if any(a.ndim != 1 for a in yts + yps):
+        return None
+    lengths = np.array([yt.size for yt in yts])
+    if any(yt.size != yp.size for yt, yp in zip(yts, yps)) or not lengths.all():
+        raise ValueError("Each y_true/y_pred pair must be non-empty and equal-sized")
+    return (np.concatenate(yts), np.concatenate(yps), lengths)
+
+
+def _regression_scores_batch(pairs: Sequence[Tuple[Any, Any]]) -> np.ndarray:
+    """
+    Compute MAE, MSE, RMSE and R2 for many models in one vectorized pass.
+
+    Returns:
+        (n_models, 4) array of (mae, mse, rmse, r2)
+    """
+    stacked = _stack_pairs(pairs, dtype=np.float64)
+    if stacked is None:
+        return np.array([_regression_scores(t, p) for t, p in pairs])
+    yt, yp, lengths = stacked
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    diff = yp - yt
+    sse = np.add.reduceat(diff * diff, offsets)
+    mae = np.add.reduceat(np.abs(diff), offsets) / lengths
+    centered = yt - np.repeat(np.add.reduceat(yt, offsets) / lengths, lengths)
+    ss_tot = np.add.reduceat(centered * centered, offsets)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(ss_tot == 0.0, (sse == 0.0).astype(np.float64), 1 - sse / ss_tot)
+    mse = sse / lengths
+    return np.column_stack([mae, mse, np.sqrt(mse), r2])
+
+
+def _classification_scores_batch(
+    pairs: Sequence[Tuple[Any, Any]], average: str
+) -> np.ndarray:
+    """
+    Compute accuracy, precision, recall and F1 for many models at once.
+
+    Integer 1-D labels are encoded together and counted per model with one
+    bincount per count type; other inputs are scored pair by pair.
+
+    Returns:
+        (n_models, 4) array of (accuracy, precision, recall, f1)
+    """
+    stacked = _stack_pairs(pairs)
+    encoded = None
+    if stacked is not None and average in FAST_AVERAGES:
+        encoded = _encode_labels(stacked[0], stacked[1])
+    if encoded is None:
+        return np.array([_classification_scores(t, p, average) for t, p in pairs])
+    codes_true, codes_pred, n_classes = encoded
+    lengths = stacked[2]
+    n_models = lengths.size
+    base = np.repeat(np.arange(n_models, dtype=np.int64) * n_classes, lengths)
+    size = n_models * n_classes
+    hit = codes_true == codes_pred
+    tp = np.bincount(base[hit] + codes_true[hit], minlength=size)
+    n_true = np.bincount(base + codes_true, minlength=size)
+    n_pred = np.bincount(base + codes_pred, minlength=size)
+    shape = (n_models, n_classes)
+    return _scores_from_counts(
+        tp.reshape(shape), n_true.reshape(shape), n_pred.reshape(shape), average
+    )
+
+
+def _set_regression(
+    model_name: str, model_version: str, mae: float, mse: float, rmse: float, r2: float
+) -> None:
+    """Set the regression gauges for one model and log its scores."""
+    for gauge, value in zip(
+        _regression_children(model_name, model_version), (mae, mse, rmse, r2)
+    ):
+        gauge.set(value)
+    logger.info(
+        "Regression Performance (%s %s) - MAE: %.4f, MSE: %.4f, RMSE: %.4f, R2: %.4f",
+        model_name,
+        model_version,
+        mae,
+        mse,
+        rmse,
+        r2,
+    )
+
+
+def _alert_mae(model_name: str, model_version: str, mae: float) -> None:
+    alert_handler.trigger_alert(
+        "REGRESSION_MAE_DEGRADATION",
+        details={
+            "model": f"{model_name} {model_version}",
+            "current_mae": mae,
+            "baseline_mae": BASELINE_METRICS["mae"],
+            "threshold_pct": PERFORMANCE_THRESHOLDS["mae_increase_pct"],
+        },
+        level="WARNING",
+    )
+
+
+def _alert_r2(model_name: str, model_version: str, r2: float) -> None:
+    alert_handler.trigger_alert(
+        "REGRESSION_R2_DEGRADATION",
+        details={
+            "model": f"{model_name} {model_version}",
+            "current_r2": r2,
+            "baseline_r2": BASELINE_METRICS["r2_score"],
+            "threshold_pct": PERFORMANCE_THRESHOLDS["r2_decrease_pct"],
+        },
+        level="WARNING",
+    )
+
+
+def _publish_regression(
+    model_name: str, model_version: str, mae: float, mse: float, rmse: float, r2: float
+) -> None:
+    """Set the regression gauges for one model and alert on degradation."""
+    _set_regression(model_name, model_version, mae, mse, rmse, r2)
+    mae_limit = _DERIVED["mae_limit"]
+    if mae_limit is not None and mae > mae_limit:
+        _alert_mae(model_name, model_version, mae)
+    r2_floor = _DERIVED["r2_floor"]
+    if r2_floor is not None and r2 < r2_floor:
+        _alert_r2(model_name, model_version, r2)
+
+
+def check_regression_batch(
+    maes: np.ndarray, r2s: np.ndarray, mae_limits: Any, r2_floors: Any
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compare many models' scores against their alert limits at once.
+
+    Limits may be arrays aligned with the scores or scalars; a NaN limit
+    never flags.
+
+    Returns:
+        Tuple of boolean masks (mae_above_limit, r2_below_floor)
+    """
+    return (np.greater(maes, mae_limits), np.less(r2s, r2_floors))
+
+
+def _publish_classification(
+    model_name: str,
+    model_version: str,
+    average: str,
+    accuracy: float,
+    precision: float,
+    recall: float,
+    f1: float,
+) -> None:
+    """Set the classification gauges for one model and alert on degradation."""
+    for gauge, value in zip(
+        _classification_children(model_name, model_version),
+        (accuracy, precision, recall, f1),
+    ):
+        gauge.set(value)
+    logger.info(
+        "Classification Performance (%s %s, avg: %s) - Accuracy: %.4f, "
+        "Precision: %.4f, Recall: %.4f, F1: %.4f",
+        model_name,
+        model_version,
+        average,
+        accuracy,
+        precision,
+        recall,
+        f1,
+    )
+    accuracy_floor = _DERIVED["accuracy_floor"]
+    if accuracy_floor is not None and accuracy < accuracy_floor:
+        alert_handler.trigger_alert(
+            "CLASSIFICATION_ACCURACY_DEGRADATION",
+            details={
+                "model": f"{model_name} {model_version}",
+                "current_accuracy": accuracy,
+                "baseline_accuracy": BASELINE_METRICS["accuracy"],
+                "threshold_abs_drop": PERFORMANCE_THRESHOLDS["accuracy_drop_abs"],
+            },
+            level="WARNING",
+        )
 
 
 def log_regression_performance(
@@ -90,49 +686,54 @@ def log_regression_performance(
         model_version (str): Version of the model.
     """
     try:
-        mae = mean_absolute_error(y_true, y_pred)
-        mse = mean_squared_error(y_true, y_pred)
-        rmse = mse**0.5
-        r2 = r2_score(y_true, y_pred)
-        MODEL_MAE.set(mae)
-        MODEL_MSE.set(mse)
-        MODEL_RMSE.set(rmse)
-        MODEL_R2_SCORE.set(r2)
-        logger.info(
-            f"Regression Performance ({model_name} {model_version}) - MAE: {mae:.4f}, MSE: {mse:.4f}, RMSE: {rmse:.4f}, R2: {r2:.4f}"
-        )
-        if BASELINE_METRICS["mae"] is not None and mae > BASELINE_METRICS["mae"] * (
-            1 + PERFORMANCE_THRESHOLDS["mae_increase_pct"] / 100
-        ):
-            alert_handler.trigger_alert(
-                "REGRESSION_MAE_DEGRADATION",
-                details={
-                    "model": f"{model_name} {model_version}",
-                    "current_mae": mae,
-                    "baseline_mae": BASELINE_METRICS["mae"],
-                    "threshold_pct": PERFORMANCE_THRESHOLDS["mae_increase_pct"],
-                },
-                level="WARNING",
-            )
-        if BASELINE_METRICS["r2_score"] is not None and r2 < BASELINE_METRICS[
-            "r2_score"
-        ] * (1 - PERFORMANCE_THRESHOLDS["r2_decrease_pct"] / 100):
-            alert_handler.trigger_alert(
-                "REGRESSION_R2_DEGRADATION",
-                details={
-                    "model": f"{model_name} {model_version}",
-                    "current_r2": r2,
-                    "baseline_r2": BASELINE_METRICS["r2_score"],
-                    "threshold_pct": PERFORMANCE_THRESHOLDS["r2_decrease_pct"],
-                },
-                level="WARNING",
-            )
+        mae, mse, rmse, r2 = _regression_scores(y_true, y_pred)
+        _publish_regression(model_name, model_version, mae, mse, rmse, r2)
     except Exception as e:
         logger.error(
-            f"Error calculating regression performance for {model_name} {model_version}: {e}"
+            "Error calculating regression performance for %s %s: %s",
+            model_name,
+            model_version,
+            e,
         )
 
 
+def log_regression_performance_batch(
+    pairs: Sequence[Tuple[Any, Any]],
+    model_names: Sequence[str],
+    model_versions: Sequence[str],
+) -> Any:
+    """
+    Calculates and logs regression performance metrics for several models.
+    Args:
+        pairs: (y_true, y_pred) pair per model.
+        model_names: Name of each model.
+        model_versions: Version of each model.
+    """
+    try:
+        if not len(pairs) == len(model_names) == len(model_versions):
+            raise ValueError("pairs, model_names and model_versions differ in length")
+        if not pairs:
+            return
+        scores = _regression_scores_batch(pairs)
+        for model_name, model_version, row in zip(
+            model_names, model_versions, scores.tolist()
+        ):
+            _set_regression(model_name, model_version, *row)
+        mae_limit, r2_floor = _DERIVED["mae_limit"], _DERIVED["r2_floor"]
+        mae_flags, r2_flags = check_regression_batch(
+            scores[:, 0],
+            scores[:, 3],
+            np.nan if mae_limit is None else mae_limit,
+            np.nan if r2_floor is None else r2_floor,
+        )
+        for i in np.flatnonzero(mae_flags).tolist():
+            _alert_mae(model_names[i], model_versions[i], float(scores[i, 0]))
+        for i in np.flatnonzero(r2_flags).tolist():
+            _alert_r2(model_names[i], model_versions[i], float(scores[i, 3]))
+    except Exception as e:
+        logger.error("Error calculating batch regression performance: %s", e)
+
+
 def log_classification_performance(
     y_true: Any,
     y_pred: Any,
@@ -152,58 +753,82 @@ def log_classification_performance(
         average (str): Averaging method for precision, recall, F1 (e.g., 	macro	, 	micro	, 	weighted	).
     """
     try:
-        accuracy = accuracy_score(y_true, y_pred)
-        precision = precision_score(y_true, y_pred, average=average, zero_division=0)
-        recall = recall_score(y_true, y_pred, average=average, zero_division=0)
-        f1 = f1_score(y_true, y_pred, average=average, zero_division=0)
-        MODEL_ACCURACY.set(accuracy)
-        MODEL_PRECISION.set(precision)
-        MODEL_RECALL.set(recall)
-        MODEL_F1_SCORE.set(f1)
-        logger.info(
-            f"Classification Performance ({model_name} {model_version}, avg: {average}) - Accuracy: {accuracy:.4f}, Precision: {precision:.4f}, Recall: {recall:.4f}, F1: {f1:.4f}"
+        accuracy, precision, recall, f1 = _memoized_scores(
+            f"classification:{average}",
+            y_true,
+            y_pred,
+            lambda: _classification_scores(y_true, y_pred, average),
+        )
+        _publish_classification(
+            model_name, model_version, average, accuracy, precision, recall, f1
         )
-        if (
-            BASELINE_METRICS["accuracy"] is not None
-            and accuracy
-            < BASELINE_METRICS["accuracy"] - PERFORMANCE_THRESHOLDS["accuracy_drop_abs"]
-        ):
-            alert_handler.trigger_alert(
-                "CLASSIFICATION_ACCURACY_DEGRADATION",
-                details={
-                    "model": f"{model_name} {model_version}",
-                    "current_accuracy": accuracy,
-                    "baseline_accuracy": BASELINE_METRICS["accuracy"],
-                    "threshold_abs_drop": PERFORMANCE_THRESHOLDS["accuracy_drop_abs"],
-                },
-                level="WARNING",
-            )
     except Exception as e:
         logger.error(
-            f"Error calculating classification performance for {model_name} {model_version}: {e}"
+            "Error calculating classification performance for %s %s: %s",
+            model_name,
+            model_version,
+            e,
         )
 
 
+def log_classification_performance_batch(
+    pairs: Sequence[Tuple[Any, Any]],
+    model_names: Sequence[str],
+    model_versions: Sequence[str],
+    average: str = "macro",
+) -> Any:
+    """
+    Calculates and logs classification performance metrics for several models.
+    Args:
+        pairs: (y_true, y_pred) pair per model.
+        model_names: Name of each model.
+        model_versions: Version of each model.
+        average (str): Averaging method for precision, recall, F1.
+    """
+    try:
+        if not len(pairs) == len(model_names) == len(model_versions):
+            raise ValueError("pairs, model_names and model_versions differ in length")
+        if not pairs:
+            return
+        scores = _classification_scores_batch(pairs, average)
+        for model_name, model_version, row in zip(
+            model_names, model_versions, scores.tolist()
+        ):
+            _publish_classification(model_name, model_version, average, *row)
+    except Exception as e:
+        logger.error("Error calculating batch classification performance: %s", e)
+
+
 def update_api_request_metrics(
     endpoint: str, method: str, status_code: int, latency_seconds: float
 ) -> Any:
     """
     Updates API request counters and latency histograms.
+
+    Updates are batched per thread and published at least every
+    REQUEST_FLUSH_INTERVAL_SECONDS; call flush_api_request_metrics() to
+    publish pending ones immediately.
     Args:
         endpoint (str): The API endpoint path.
         method (str): The HTTP method (e.g., GET, POST).
-        status_code (int): The HTTP status code of the response.
+        status_code (int): The HTTP status code of the response; counted by
+            class (2xx, 3xx, 4xx, 5xx or other) to bound label cardinality.
         latency_seconds (float): The duration of the request in seconds.
     """
     try:
-        API_REQUESTS_TOTAL.labels(
-            endpoint=endpoint, method=method, status_code=status_code
-        ).inc()
-        API_REQUEST_LATENCY.labels(endpoint=endpoint, method=method).observe(
-            latency_seconds
+        _request_batches.record(
+            endpoint, method, _status_bucket(status_code), latency_seconds
         )
+    except (TypeError, ValueError) as e:
+        logger.error("Error updating API request metrics: %s", e)
+
+
+def flush_api_request_metrics() -> Any:
+    """Publishes API request updates still buffered by any thread."""
+    try:
+        _request_batches.flush()
     except Exception as e:
-        logger.error(f"Error updating API request metrics: {e}")
+        logger.error("Error flushing API request metrics: %s", e)
 
 
 def update_prediction_latency(
@@ -216,17 +841,16 @@ def update_prediction_latency(
         model_version (str): Version of the model.
         latency_seconds (float): The duration of the prediction in seconds.
     """
+    child = _resolve_child(_prediction_child, model_name, model_version)
+    if child is None:
+        return
     try:
-        PREDICTION_LATENCY.labels(
-            model_name=model_name, model_version=model_version
-        ).observe(latency_seconds)
-    except Exception as e:
-        logger.error(f"Error updating prediction latency: {e}")
+        child.observe(float(latency_seconds))
+    except (TypeError, ValueError) as e:
+        logger.error("Error updating prediction latency: %s", e)
 
 
 if __name__ == "__main__":
-    import random
-
     logger.info("Starting performance monitoring example...")
     logger.info("\n--- Simulating Regression Model Performance ---")
     y_true_reg = [3, -0.5, 2, 7, 4.2, 5.5, 6.1, 2.3, 8.0, 9.5]
@@ -261,23 +885,40 @@ if __name__ == "__main__":
         model_version="v1.0.0",
     )
     logger.info("\n--- Simulating API Requests & Latency ---")
-    endpoints = ["/predict", "/health", "/features"]
-    methods = ["POST", "GET"]
-    for i in range(100):
-        endpoint = random.choice(endpoints)
-        method = random.choice(methods) if endpoint != "/health" else "GET"
-        status = random.choices([200, 201, 400, 404, 500], weights=[70, 10, 10, 5, 5])[
-            0
-        ]
-        latency = random.uniform(0.001, 1.5)
+    rng = np.random.default_rng()
+    endpoints = np.array(["/predict", "/health", "/features"])
+    methods = np.array(["POST", "GET"])
+    n_requests = 100
+    request_endpoints = endpoints[rng.integers(0, endpoints.size, n_requests)]
+    request_methods = np.where(
+        request_endpoints == "/health",
+        "GET",
+        methods[rng.integers(0, methods.size, n_requests)],
+    )
+    statuses = rng.choice(
+        [200, 201, 400, 404, 500], size=n_requests, p=[0.7, 0.1, 0.1, 0.05, 0.05]
+    )
+    latencies = rng.uniform(0.001, 1.5, n_requests)
+    for endpoint, method, status, latency in zip(
+        request_endpoints.tolist(),
+        request_methods.tolist(),
+        statuses.tolist(),
+        latencies.tolist(),
+    ):
         update_api_request_metrics(endpoint, method, status, latency)
         time.sleep(0.01)
+    flush_api_request_metrics()
     logger.info("Simulated 100 API requests.")
     logger.info("\n--- Simulating Prediction Latency ---")
-    for i in range(50):
-        model_name = random.choice(["SalesForecaster", "FraudDetector"])
-        model_version = "v1.0.0" if model_name == "SalesForecaster" else "v2.1.0"
-        pred_latency = random.uniform(0.005, 0.25)
+    n_predictions = 50
+    model_names = np.array(["SalesForecaster", "FraudDetector"])[
+        rng.integers(0, 2, n_predictions)
+    ]
+    model_versions = np.where(model_names == "SalesForecaster", "v1.0.0", "v2.1.0")
+    pred_latencies = rng.uniform(0.005, 0.25, n_predictions)
+    for model_name, model_version, pred_latency in zip(
+        model_names.tolist(), model_versions.tolist(), pred_latencies.tolist()
+    ):
         update_prediction_latency(model_name, model_version, pred_latency)
         time.sleep(0.02)
     logger.info("Simulated 50 model predictions.")